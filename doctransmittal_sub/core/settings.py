@@ -99,6 +99,11 @@ class SettingsManager:
             cur = cur.get(part, default if i == len(parts) - 1 else {})
         return cur
 
+    def snapshot(self, prefix: str = "") -> Dict[str, Any]:
+        """Shallow copy of the section under a dotted `prefix` (e.g. "ui."), read in one lookup."""
+        node = self.get(prefix.strip("."), {}) if prefix.strip(".") else self._data
+        return dict(node) if isinstance(node, dict) else {}
+
     def set(self, dotted: str, value: Any) -> None:
         parts = dotted.split(".")
         cur = self._data
@@ -1,15 +1,70 @@
 from __future__ import annotations
+import os
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional, Iterable
+from typing import List, Dict, Tuple, Optional, Iterable, Iterator
 import re
 
+
+def iter_files(root: str | os.PathLike) -> Iterator[os.DirEntry]:
+    """
+    Yield a DirEntry for every file under `root` using an explicit os.scandir
+    stack. File/dir type comes from the directory listing, so no extra stat
+    is issued per entry. Unreadable folders are skipped.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        d = stack.pop()
+        try:
+            with os.scandir(d) as it:
+                for e in it:
+                    try:
+                        if e.is_dir(follow_symlinks=False):
+                            stack.append(e.path)
+                        elif e.is_file():
+                            yield e
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+class FilenameIndex:
+    """
+    One walk over the search roots, reusable across autofind calls.
+      files          -> [(path, name, stem, ext_lower)], sorted by name per root
+      by_stem_upper  -> {STEM: [entry, ...]} in the same order
+    """
+    def __init__(self, search_roots: Iterable[str | os.PathLike]):
+        self.files: List[Tuple[str, str, str, str]] = []
+        for root in search_roots or []:
+            if not root or not os.path.isdir(root):
+                continue
+            entries = []
+            for e in iter_files(root):
+                stem, ext = os.path.splitext(e.name)
+                entries.append((e.path, e.name, stem, ext.lower()))
+            # predictable order for determinism
+            entries.sort(key=lambda t: t[1].lower())
+            self.files.extend(entries)
+        self.by_stem_upper: Dict[str, List[Tuple[str, str, str, str]]] = {}
+        for entry in self.files:
+            self.by_stem_upper.setdefault(entry[2].upper(), []).append(entry)
+
+    def lookup_stem(self, stem: str) -> List[Tuple[str, str, str, str]]:
+        """Entries whose stem equals `stem` (case-insensitive)."""
+        return self.by_stem_upper.get((stem or "").upper(), [])
+
+
 def suggest_mapping(doc_ids: List[str], search_roots: List[Path], prefer_revision_suffix: bool = True,
-                    extensions: List[str] | None = None) -> Dict[str, List[Tuple[Path, float, Optional[str]]]]:
+                    extensions: List[str] | None = None,
+                    index: FilenameIndex | None = None) -> Dict[str, List[Tuple[Path, float, Optional[str]]]]:
     if extensions: extensions = [e.lower() for e in extensions]
-    out: Dict[str, List[Tuple[Path, float, Optional[str]]]] = {d: [] for d in doc_ids}
+    if index is None: index = FilenameIndex(search_roots)
+    # Collected as plain strings (name kept for sorting); Paths are built once at the end
+    raw: Dict[str, List[Tuple[str, float, Optional[str], str]]] = {d: [] for d in doc_ids}
     trailing_re = re.compile(r"(?i)[_\\-\\s]([A-Za-z0-9]+)$")
-    def consider(doc: str, p: Path):
-        stem = p.stem; conf, rev = 0.0, None
+    def consider(doc: str, p: str, name: str, stem: str):
+        conf, rev = 0.0, None
         if stem == doc: conf = 0.9
         elif stem.startswith(doc): conf = 0.8
         elif doc in stem: conf = 0.6
@@ -18,27 +73,28 @@ def suggest_mapping(doc_ids: List[str], search_roots: List[Path], prefer_revisio
             rev = m.group(1).upper()
             if stem.startswith(doc) and (prefer_revision_suffix or rev):
                 conf = max(conf, 1.0)
-        out.setdefault(doc, []).append((p, conf, rev))
-    for root in search_roots:
-        if not root.exists(): continue
-        for p in root.rglob("*"):
-            if not p.is_file(): continue
-            if extensions and p.suffix.lower() not in extensions: continue
-            name = p.name
-            for doc in doc_ids:
-                if doc in name: consider(doc, p)
-    for k, lst in out.items(): lst.sort(key=lambda t: (-t[1], t[0].name.lower()))
+        raw.setdefault(doc, []).append((p, conf, rev, name.lower()))
+    for p, name, stem, ext in index.files:
+        if extensions and ext not in extensions: continue
+        for doc in doc_ids:
+            if doc in name: consider(doc, p, name, stem)
+    out: Dict[str, List[Tuple[Path, float, Optional[str]]]] = {}
+    for k, lst in raw.items():
+        lst.sort(key=lambda t: (-t[1], t[3]))
+        out[k] = [(Path(p), conf, rev) for p, conf, rev, _ in lst]
     return out
 
 
 def find_docid_rev_matches(
     doc_revs: Iterable[Tuple[str, str]],
     search_roots: List[Path],
-    extensions: List[str] | None = None
+    extensions: List[str] | None = None,
+    index: FilenameIndex | None = None,
 ) -> Dict[str, Path]:
     """
     Return {doc_id: Path} for files whose STEM == f"{DocID}_{Revision}" (case-insensitive).
     If multiple matches exist, the first encountered (sorted by name) is used.
+    Pass a prebuilt `index` to skip walking `search_roots` again.
     """
     if extensions:
         extensions = [e.lower() for e in extensions]
@@ -50,18 +106,15 @@ def find_docid_rev_matches(
         stem = f"{doc}_{rev}".upper()
         wanted[stem] = doc
 
+    if index is None:
+        index = FilenameIndex(search_roots)
     found: Dict[str, Path] = {}
-    for root in search_roots or []:
-        if not root or not Path(root).exists():
+    for stem, doc in wanted.items():
+        if doc in found:
             continue
-        # predictable order for determinism
-        files = sorted(root.rglob("*"), key=lambda p: p.name.lower())
-        for p in files:
-            if not p.is_file():
-                continue
-            if extensions and p.suffix.lower() not in extensions:
+        for p, _name, _stem, ext in index.lookup_stem(stem):
+            if extensions and ext not in extensions:
                 continue
-            stem = p.stem.upper()
-            if stem in wanted and wanted[stem] not in found:
-                found[wanted[stem]] = p
-    return found
\ No newline at end of file
+            found[doc] = Path(p)
+            break
+    return found
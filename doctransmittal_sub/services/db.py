@@ -3,7 +3,7 @@ from __future__ import annotations
 import json
 import sqlite3, time
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 
 # -------------------------------- connection --------------------------------
 
@@ -17,6 +17,15 @@ def _connect(db_path: Path) -> sqlite3.Connection:
     con.execute("PRAGMA busy_timeout = 5000;")
     return con
 
+def _bulk_pragmas(con: sqlite3.Connection) -> None:
+    """
+    Per-connection settings for one-transaction bulk imports: temp tables in RAM and a
+    64 MB page cache. They end with the connection. A crash mid-import rolls the whole
+    transaction back; WAL + synchronous=NORMAL (see _connect) already avoid an fsync per commit.
+    """
+    con.execute("PRAGMA temp_store = MEMORY;")
+    con.execute("PRAGMA cache_size = -65536;")
+
 def _retry_write(fn, retries: int = 5, base_delay: float = 0.15):
     for i in range(retries):
         try:
@@ -442,20 +451,24 @@ def get_project(db_path: Path) -> Optional[Dict[str, Any]]:
 
 # ------------------------------ Documents / Revisions (existing) ------------------------------
 
+# One SQL string per statement: sqlite3 caches compiled statements by text,
+# so every caller (single or executemany) reuses the same prepared statement.
+_UPSERT_DOCUMENT_SQL = """INSERT INTO documents(project_id,doc_id,doc_type,file_type,description,status,is_active)
+                          VALUES(?,?,?,?,?,?,?)
+                          ON CONFLICT(project_id,doc_id) DO UPDATE SET
+                            doc_type=excluded.doc_type,
+                            file_type=excluded.file_type,
+                            description=excluded.description,
+                            status=excluded.status,
+                            is_active=excluded.is_active"""
+
 def upsert_document(db_path: Path, project_id: int, doc: Dict[str, Any]) -> int:
     """
     doc: {doc_id, doc_type, file_type, description, status, is_active}
     """
     def _do():
         con = _connect(db_path); cur = con.cursor()
-        cur.execute("""INSERT INTO documents(project_id,doc_id,doc_type,file_type,description,status,is_active)
-                       VALUES(?,?,?,?,?,?,?)
-                       ON CONFLICT(project_id,doc_id) DO UPDATE SET
-                         doc_type=excluded.doc_type,
-                         file_type=excluded.file_type,
-                         description=excluded.description,
-                         status=excluded.status,
-                         is_active=excluded.is_active""",
+        cur.execute(_UPSERT_DOCUMENT_SQL,
                     (project_id, doc["doc_id"].strip(), doc.get("doc_type",""), doc.get("file_type",""),
                      doc.get("description",""), doc.get("status",""), int(doc.get("is_active",1))))
         row = cur.execute("SELECT id FROM documents WHERE project_id=? AND doc_id=?",
@@ -507,6 +520,119 @@ def add_revision_by_docid(db_path: Path, project_id: int, doc_id: str, rev: str,
     return _retry_write(_do)
 
 
+def add_revisions_by_docid(db_path: Path, project_id: int, revs: Dict[str, str], notes: str = "") -> int:
+    """
+    add_revision_by_docid for many documents over one connection/transaction.
+    revs: {doc_id: rev}. Returns how many documents were found (and written).
+    """
+    params = [(rev.strip(), notes, project_id, doc_id.strip()) for doc_id, rev in revs.items()]
+    if not params:
+        return 0
+    def _do():
+        con = _connect(db_path); cur = con.cursor()
+        try:
+            # REPLACE so an existing rev becomes the newest row (new id)
+            cur.executemany("""INSERT OR REPLACE INTO revisions(document_id,rev,notes,created_on)
+                               SELECT id, ?, ?, date('now') FROM documents
+                               WHERE project_id=? AND doc_id=?""", params)
+            n = cur.rowcount
+            con.commit()
+        except Exception:
+            con.rollback(); raise
+        finally:
+            con.close()
+        return n
+    return _retry_write(_do)
+
+
+def upsert_documents_bulk(db_path: Path, project_id: int, docs: List[Dict[str, Any]]) -> int:
+    """
+    Upsert many documents (and their `latest_rev`, if given) in one transaction.
+    Same semantics as upsert_document + add_revision per row: a rev the document
+    already has is left alone (notes, created_on and id kept). Returns docs written.
+    """
+    doc_params = [(project_id, d["doc_id"].strip(), d.get("doc_type",""), d.get("file_type",""),
+                   d.get("description",""), d.get("status",""), int(d.get("is_active",1)))
+                  for d in docs]
+    rev_params = [(d["latest_rev"].strip(), project_id, d["doc_id"].strip())
+                  for d in docs if (d.get("latest_rev") or "").strip()]
+    if not doc_params:
+        return 0
+    def _do():
+        con = _connect(db_path); cur = con.cursor()
+        _bulk_pragmas(con)
+        try:
+            cur.executemany(_UPSERT_DOCUMENT_SQL, doc_params)
+            # IGNORE, not REPLACE: re-importing an older rev must not make it "latest"
+            cur.executemany("""INSERT OR IGNORE INTO revisions(document_id,rev,notes,created_on)
+                               SELECT id, ?, '', date('now') FROM documents
+                               WHERE project_id=? AND doc_id=?""", rev_params)
+            con.commit()
+        except Exception:
+            con.rollback(); raise
+        finally:
+            con.close()
+        return len(doc_params)
+    return _retry_write(_do)
+
+
+def insert_new_documents_bulk(db_path: Path, project_id: int, docs: Iterable[Dict[str, Any]]) -> Tuple[int, int]:
+    """
+    Import `docs` whose doc_id is not already in the project (compared trimmed, case-insensitive),
+    together with their `latest_rev`. Rows are staged in a temp table and the dedupe runs in
+    SQLite, so existing doc ids are never loaded into Python. `docs` may be a generator (only
+    the six import fields of each row are kept). Returns (inserted, skipped).
+    """
+    # a list, not a generator: _retry_write may need to stage the rows again.
+    # The dedupe key (trimmed, upper-cased id) is computed once here, not per comparison.
+    stage = []
+    for i, d in enumerate(docs):
+        did = (d.get("doc_id") or "").strip()
+        stage.append((i, did, did.upper(), d.get("doc_type",""), d.get("file_type",""),
+                      d.get("description",""), d.get("status",""), (d.get("latest_rev") or "").strip()))
+    if not stage:
+        return 0, 0
+    def _do():
+        con = _connect(db_path); cur = con.cursor()
+        _bulk_pragmas(con)
+        try:
+            # No index work to defer here: _doc_stage has only its rowid key, and every index on
+            # documents/revisions is a UNIQUE constraint the upserts below resolve conflicts with.
+            cur.execute("""CREATE TEMP TABLE IF NOT EXISTS _doc_stage(
+                               seq INTEGER PRIMARY KEY, doc_id TEXT, doc_key TEXT, doc_type TEXT, file_type TEXT,
+                               description TEXT, status TEXT, latest_rev TEXT, fresh INTEGER DEFAULT 1)""")
+            cur.execute("DELETE FROM _doc_stage")
+            cur.executemany("""INSERT INTO _doc_stage(seq,doc_id,doc_key,doc_type,file_type,description,status,latest_rev)
+                               VALUES(?,?,?,?,?,?,?,?)""", stage)
+            # anti-join: IN (subquery) is evaluated once into a transient index
+            cur.execute("""UPDATE _doc_stage SET fresh = 0
+                           WHERE doc_key = '' OR doc_key IN (
+                               SELECT UPPER(TRIM(doc_id)) FROM documents WHERE project_id=?)""",
+                        (project_id,))
+            cur.execute("""INSERT INTO documents(project_id,doc_id,doc_type,file_type,description,status,is_active)
+                           SELECT ?, doc_id, doc_type, file_type, description, status, 1
+                           FROM _doc_stage WHERE fresh ORDER BY seq
+                           ON CONFLICT(project_id,doc_id) DO UPDATE SET
+                             doc_type=excluded.doc_type,
+                             file_type=excluded.file_type,
+                             description=excluded.description,
+                             status=excluded.status,
+                             is_active=excluded.is_active""", (project_id,))
+            inserted = con.execute("SELECT COUNT(*) FROM _doc_stage WHERE fresh").fetchone()[0]
+            cur.execute("""INSERT OR REPLACE INTO revisions(document_id,rev,notes,created_on)
+                           SELECT d.id, s.latest_rev, '', date('now')
+                           FROM _doc_stage s JOIN documents d ON d.project_id=? AND d.doc_id=s.doc_id
+                           WHERE s.fresh AND s.latest_rev <> '' ORDER BY s.seq""", (project_id,))
+            cur.execute("DELETE FROM _doc_stage")
+            con.commit()
+        except Exception:
+            con.rollback(); raise
+        finally:
+            con.close()
+        return inserted, len(stage) - inserted
+    return _retry_write(_do)
+
+
 def list_documents_with_latest(db_path: Path, project_id: int, state: str = "active") -> List[Dict[str, Any]]:
     con = _connect(db_path)
     where = "d.project_id=?"
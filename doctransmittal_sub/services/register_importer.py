@@ -16,11 +16,10 @@ def import_excel_register_to_db(
     regdb.init_db(db_path)
     pid = regdb.upsert_project(db_path, project_code.strip(), project_name.strip(), str(project_root or excel_path.parent))
     rows = read_register(excel_path)  # your existing parser
-    for r in rows:
-        # r: DocumentRow(doc_id, doc_type, file_type, description, status, latest_rev_raw, latest_token, row_num)
-        did = regdb.upsert_document(db_path, pid, {
-            "doc_id": r.doc_id, "doc_type": r.doc_type, "file_type": r.file_type,
-            "description": r.description, "status": r.status, "is_active": 1
-        })
-        if r.latest_rev_token:
-            regdb.add_revision(db_path, did, r.latest_rev_token)
+    # r: DocumentRow(doc_id, doc_type, file_type, description, status, latest_rev_raw, latest_token, row_num)
+    # documents + their latest revisions in one transaction
+    regdb.upsert_documents_bulk(db_path, pid, [{
+        "doc_id": r.doc_id, "doc_type": r.doc_type, "file_type": r.file_type,
+        "description": r.description, "status": r.status, "is_active": 1,
+        "latest_rev": r.latest_rev_token or "",
+    } for r in rows])
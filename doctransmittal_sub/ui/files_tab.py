@@ -1,31 +1,42 @@
 from __future__ import annotations
 
+import os
 import shutil
+from collections import Counter
+from datetime import datetime, date
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 
-from PyQt5.QtCore import Qt, QModelIndex, pyqtSignal, QUrl
-from PyQt5.QtGui import QColor, QBrush, QPalette
+from PyQt5.QtCore import Qt, QModelIndex, pyqtSignal, QUrl, QTimer, QObject, QRunnable, QThreadPool
+from PyQt5.QtGui import QColor, QBrush, QPalette, QStandardItemModel, QStandardItem
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QSplitter, QGroupBox,
-    QListWidget, QListWidgetItem, QTreeView, QFileSystemModel,
+    QListWidget, QListWidgetItem, QTreeView,
     QPushButton, QLabel, QMessageBox, QFileDialog,
-    QStyledItemDelegate, QStyleOptionViewItem, QLineEdit,
+    QStyledItemDelegate, QLineEdit,
     QAbstractItemView, QToolButton, QMenu,
 )
 from PyQt5.QtGui import QDragEnterEvent, QDragMoveEvent, QDropEvent
 
+try:
+    from .widgets.lazy_fs_model import LazyFsModel  # type: ignore
+except Exception:
+    from ui.widgets.lazy_fs_model import LazyFsModel  # type: ignore
+
 # --- Autofind helpers ---
 try:
-    from ..services.autofind import suggest_mapping, find_docid_rev_matches  # type: ignore
+    from ..services.autofind import suggest_mapping, find_docid_rev_matches, FilenameIndex, iter_files  # type: ignore
 except Exception:
     try:
-        from services.autofind import suggest_mapping, find_docid_rev_matches  # type: ignore
+        from services.autofind import suggest_mapping, find_docid_rev_matches, FilenameIndex, iter_files  # type: ignore
     except Exception:
         # Fallback stubs to avoid crashes in design-time
-        def suggest_mapping(doc_ids, roots):
+        FilenameIndex = None
+        def iter_files(root):
+            return iter(())
+        def suggest_mapping(doc_ids, roots, index=None):
             return {}
-        def find_docid_rev_matches(pairs, roots, extensions=None):
+        def find_docid_rev_matches(pairs, roots, extensions=None, index=None):
             return {}
 
 # --- Transmittal service ---
@@ -135,7 +146,15 @@ class _MapHighlightDelegate(QStyledItemDelegate):
         self._green = QColor(46, 160, 67)
         self._amber = QColor(210, 130, 10)
 
-    def paint(self, painter, option, index):
+    def initStyleOption(self, option, index):
+        # paint() already works on its own copy of the option; tinting here
+        # avoids a second QStyleOptionViewItem copy per painted cell.
+        super().initStyleOption(option, index)
+        tab = self._tab
+        # Nothing mapped and no duplicates (e.g. no root chosen yet): no tint possible,
+        # so skip the per-cell path lookups entirely.
+        if not tab._dup_paths_set_frozen and not tab._used_paths_set():
+            return
         try:
             model = index.model()
             if not model.isDir(index):
@@ -143,24 +162,129 @@ class _MapHighlightDelegate(QStyledItemDelegate):
                 if fp:
                     # If this exact path is manually mapped, show manual green (overrides duplicate amber)
                     if self._tab._is_manual_mapped_path(fp):
-                        opt = QStyleOptionViewItem(option)
-                        opt.palette.setColor(QPalette.Text, getattr(self._tab, "_green_manual", QColor(38, 185, 110)))
-                        return super().paint(painter, opt, index)
-
+                        option.palette.setColor(QPalette.Text, getattr(self._tab, "_green_manual", QColor(38, 185, 110)))
                     # Duplicates (only if not manually chosen)
-                    if self._tab._is_duplicate_basename(fp):
-                        opt = QStyleOptionViewItem(option)
-                        opt.palette.setColor(QPalette.Text, self._amber)
-                        return super().paint(painter, opt, index)
-
+                    elif self._tab._is_duplicate_path(fp):
+                        option.palette.setColor(QPalette.Text, self._amber)
                     # Auto/normal mapped
-                    if fp in self._tab._used_paths_set():
-                        opt = QStyleOptionViewItem(option)
-                        opt.palette.setColor(QPalette.Text, getattr(self._tab, "_green_auto", QColor(46, 160, 67)))
-                        return super().paint(painter, opt, index)
+                    elif fp in self._tab._used_paths_set():
+                        option.palette.setColor(QPalette.Text, getattr(self._tab, "_green_auto", QColor(46, 160, 67)))
         except Exception:
             pass
-        return super().paint(painter, option, index)
+
+
+# ===================== Path helpers =====================
+def _realpath(p: str) -> str:
+    try:
+        return os.path.realpath(p)
+    except Exception:
+        return os.path.normpath(p)
+
+
+# ===================== Payload helpers =====================
+# Optional per-item fields handed on to the transmittal/CheckPrint services
+# (doc_id, revision and file_path are always set). Absent ones fall back to the
+# register snapshot on the DB side.
+_SNAPSHOT_FIELDS = ("doc_type", "file_type", "description", "status")
+
+
+def _item_field(it, key: str):
+    """Read `key` from a payload item, dict or attribute object; None if absent."""
+    if isinstance(it, dict):
+        return it.get(key)
+    return getattr(it, key, None)
+
+
+# ===================== Scan helpers =====================
+_DUP_SCAN_EMIT_EVERY = 5000  # files between progress callbacks
+
+
+def _find_docrev_duplicates(root: str, pairs: List[Tuple[str, str]],
+                            progress=None, norm_out: Optional[Dict[str, str]] = None) -> Dict[str, List[str]]:
+    """
+    Walk `root` once and return {doc_id: [raw paths]} for DocIDs with more than one file
+    named <DocID>_<REV>.<ext>, <DocID>-<REV>.<ext> or <DocID> <REV>.<ext> (case-insensitive,
+    ext alphanumeric). Names come straight from os.scandir; nothing is stat'ed or resolved.
+    `progress(seen_files, dup_docids_so_far)` is called every _DUP_SCAN_EMIT_EVERY files.
+    If `norm_out` is given it is filled with {raw path -> realpath} for each non-symlink
+    file whose name matches a wanted DocID+Rev, so it stays as small as the match set:
+    the walk never follows directory links, so that is just the resolved root prefix
+    plus the listed tail (no extra syscalls).
+    """
+    wanted: Dict[str, List[str]] = {}  # lower-cased base -> doc_ids
+    for did, rv in pairs:
+        if not did or not rv:
+            continue
+        for b in {f"{did}_{rv}", f"{did}-{rv}", f"{did} {rv}"}:
+            dids = wanted.setdefault(b.lower(), [])
+            if did not in dids:
+                dids.append(did)
+    if not wanted:
+        return {}
+    # Most DocIDs match exactly one file: keep that single path, and only
+    # start a list once a second match turns up.
+    counts: Counter = Counter()
+    first: Dict[str, str] = {}
+    dups: Dict[str, List[str]] = {}
+    seen = 0
+    seps = (os.sep, os.altsep or os.sep)
+    raw_prefix = root if root.endswith(seps) else root + os.sep
+    real_root = os.path.realpath(root) if norm_out is not None else ""
+    real_prefix = real_root if real_root.endswith(seps) else real_root + os.sep
+    cut = len(raw_prefix)
+    for e in iter_files(root):
+        seen += 1
+        if progress is not None and seen % _DUP_SCAN_EMIT_EVERY == 0:
+            progress(seen, len(dups))
+        stem, dot, ext = e.name.rpartition(".")
+        if not dot or not ext.isascii() or not ext.isalnum():
+            continue
+        dids = wanted.get(stem.lower())
+        if not dids:
+            continue
+        if norm_out is not None:
+            p = e.path
+            try:
+                if p.startswith(raw_prefix) and not e.is_symlink():
+                    norm_out[p] = real_prefix + p[cut:]
+            except OSError:
+                pass
+        for did in dids:
+            counts[did] += 1
+            if counts[did] == 1:
+                first[did] = e.path
+            elif counts[did] == 2:
+                dups[did] = [first.pop(did), e.path]
+            else:
+                dups[did].append(e.path)
+    return dups
+
+
+class _DupScanSignals(QObject):
+    partial = pyqtSignal(int, int, int)  # (scan generation, files seen, DocIDs with duplicates so far)
+    finished = pyqtSignal(int, object, object)  # (generation, {doc_id: [raw duplicate paths]}, {raw path: realpath})
+
+
+class _DupScanTask(QRunnable):
+    """Runs _find_docrev_duplicates on the global thread pool and reports back via signals."""
+    def __init__(self, generation: int, root: str, pairs: List[Tuple[str, str]]):
+        super().__init__()
+        self.signals = _DupScanSignals()
+        self._generation = generation
+        self._root = root
+        self._pairs = list(pairs)
+
+    def run(self):
+        norm: Dict[str, str] = {}
+        try:
+            hits = _find_docrev_duplicates(
+                self._root, self._pairs,
+                progress=lambda seen, n: self.signals.partial.emit(self._generation, seen, n),
+                norm_out=norm,
+            )
+        except Exception:
+            hits = {}
+        self.signals.finished.emit(self._generation, hits, norm)
 
 
 # ===================== Main Tab =====================
@@ -170,15 +294,31 @@ class FilesTab(QWidget):
     remapCompleted = pyqtSignal(str, str)  # (transmittal_number, dir_path) after edit/remap
     checkprintStarted = pyqtSignal(str, str)  # (cp_code, cp_dir)
 
+    # Shared foreground brushes for the doc/mapped lists
+    _BRUSH_GREEN_AUTO = QBrush(QColor(46, 160, 67))
+    _BRUSH_GREEN_MANUAL = QBrush(QColor(38, 185, 110))
+    _BRUSH_AMBER = QBrush(QColor(210, 130, 10))
+    _BRUSH_RED = QBrush(QColor(200, 60, 60))
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
         # Core state
         self.db_path: Optional[Path] = None
         self.root_dir: Optional[Path] = None
+        self._root_real: Optional[str] = None  # realpath of root_dir, cached per root change
+        self._fname_index = None  # autofind FilenameIndex for root_dir, built on first use
         self.items: List[dict] = []
+        # Per-item fields extracted once in set_flow_context:
+        # {"doc_id", "revision" (normalised), "item" (the original payload entry)}
+        self._items_norm: List[dict] = []
         self.doc_ids: List[str] = []
-        self.mapping: Dict[str, str] = {}  # {doc_id -> absolute path}
+        # Mapped path per row of doc_ids (None = unmapped); `mapping` caches the dict form.
+        # A DocID listed twice maps every one of its rows to the same path.
+        self._mapping_by_index: List[Optional[str]] = []
+        self._doc_id_to_rows: Dict[str, List[int]] = {}
+        self._mapping_cache: Optional[Dict[str, str]] = None  # cleared on every mapping change
+        self._path_to_doc: Dict[str, str] = {}  # reverse of the mapping; keep in sync via _set_mapping/_pop_mapping
         self.user = self.title = self.client = ""
 
         # Edit/remap state
@@ -190,8 +330,30 @@ class FilesTab(QWidget):
         # Duplicate tracking state (names and full paths that belong to *selected* DocID+Rev duplicates)
         self._dup_names: set[str] = set()
         self._dup_paths: set[str] = set()
+        # Frozen copy of _dup_paths for O(1) membership on the paint/colour paths
+        self._dup_paths_set_frozen: frozenset = frozenset()
+        # Bumped per duplicate scan; results from older scans are dropped
+        self._scan_generation: int = 0
+        self._dup_scan_task: Optional[_DupScanTask] = None
+        # {raw path -> realpath} under root_dir: seeded by the duplicate scan with the
+        # DocID+Rev-named files it matched, then filled by _normpath; dropped per root/scan
+        self._path_norm_cache: Dict[str, str] = {}
         # --- NEW: track manual mappings so we can tint them differently ---
         self._manual_mapped_docids: set[str] = set()
+        # Normalised mapped/manual path sets, rebuilt lazily after mapping changes
+        self._used_paths_cache: Optional[frozenset] = None
+        self._manual_paths_cache: Optional[frozenset] = None
+        # Set while several list refreshes run back to back so colours are applied once
+        self._suspend_colors: bool = False
+        # A tree repaint is queued for the next event-loop turn
+        self._tree_update_pending: bool = False
+        # A full list recolour is queued for the next event-loop turn
+        self._pending_color_refresh: bool = False
+        # Live list rows and their last label, reused while the row count is unchanged
+        self._doc_items: List[QListWidgetItem] = []
+        self._doc_texts: List[str] = []
+        self._map_items: List[QListWidgetItem] = []
+        self._map_texts: List[str] = []
         # --- NEW: greens ---
         self._green_auto = QColor(46, 160, 67)  # existing
         self._green_manual = QColor(38, 185, 110)  # slightly different shade
@@ -206,10 +368,16 @@ class FilesTab(QWidget):
         left_box = QGroupBox("File tree", self)
         left_v = QVBoxLayout(left_box)
 
-        self.model = QFileSystemModel(self)
-        self.model.setRootPath("")
+        # No filesystem model until a root is chosen (see _fs_model); until then the
+        # tree shows a one-row hint and touches nothing on disk.
+        self.model: Optional[LazyFsModel] = None
+        self._placeholder_model = QStandardItemModel(self)
+        self._placeholder_model.setHorizontalHeaderLabels(["Name"])
+        hint = QStandardItem("Click 'Choose Root Folder…' to begin")
+        hint.setFlags(Qt.ItemIsEnabled)
+        self._placeholder_model.appendRow(hint)
         self.tree = QTreeView(self)
-        self.tree.setModel(self.model)
+        self.tree.setModel(self._placeholder_model)
         self.tree.setHeaderHidden(False)
         self.tree.setSelectionMode(QAbstractItemView.SingleSelection)
         self.tree.setDragEnabled(True)
@@ -330,10 +498,10 @@ class FilesTab(QWidget):
 
         # Reset tree to its root
         try:
-            self.tree.setRootIndex(self.model.index(self.model.rootPath()))
+            self.tree.setRootIndex(QModelIndex())
         except Exception:
             pass
-        self.tree.viewport().update()
+        self._schedule_tree_update()
 
     # ===== Public API =====
     def set_flow_context(self, *, db_path: Path, items: List[dict],
@@ -341,30 +509,34 @@ class FilesTab(QWidget):
                          created_on: str = ""):
         self.db_path = Path(db_path) if db_path else None
         self.items = items or []
-        self.doc_ids = [
-            (it.get("doc_id") if isinstance(it, dict) else getattr(it, "doc_id", "")) or ""
-            for it in (self.items or [])
-        ]
-        self.mapping = {}
+        self._items_norm = self._normalise_items(self.items)
+        self.doc_ids = [n["doc_id"] for n in self._items_norm]
+        self._doc_id_to_rows = {}
+        for i, d in enumerate(self.doc_ids):
+            self._doc_id_to_rows.setdefault(d, []).append(i)
+        self._clear_mapping()
         for d in self.doc_ids:
             p = (file_mapping or {}).get(d)
             if p:
-                self.mapping[d] = self._normpath(p)
+                self._set_mapping(d, self._normpath(p))
+        self._invalidate_used_cache()
         self.user, self.title, self.client = user, title, client
-        self._refresh_doc_list()
-        self._refresh_map_list()
+        self._suspend_colors = True
+        try:
+            self._refresh_doc_list()
+            self._refresh_map_list()
+        finally:
+            self._suspend_colors = False
+        self._apply_colors()
 
         # Prefill date (if ISO in payload, show as DD/MM/YYYY or DD/MM/YYYY HH:MM)
         try:
             disp = (created_on or "").strip()
             if len(disp) >= 10 and disp[4:5] == "-" and disp[7:8] == "-":
-                from datetime import datetime as _dt
-                fmt_in = "%Y-%m-%d %H:%M" if ":" in disp else "%Y-%m-%d"
-                dt = _dt.strptime(disp, fmt_in)
-                disp = dt.strftime("%d/%m/%Y %H:%M") if ":" in disp else dt.strftime("%d/%m/%Y")
+                dt = datetime.fromisoformat(disp)
+                disp = dt.strftime("%d/%m/%Y %H:%M" if ":" in disp else "%d/%m/%Y")
             if not disp:
-                from datetime import date as _d
-                disp = _d.today().strftime("%d/%m/%Y")
+                disp = date.today().strftime("%d/%m/%Y")
             if hasattr(self, "le_date"):
                 self.le_date.setText(disp)
         except Exception:
@@ -391,32 +563,52 @@ class FilesTab(QWidget):
             created_on=payload.get("created_on") or "",
         )
 
+    @property
+    def mapping(self) -> Dict[str, str]:
+        """{doc_id -> absolute path} for mapped rows (cached until the mapping changes)."""
+        if self._mapping_cache is None:
+            ids = self.doc_ids
+            self._mapping_cache = {ids[i]: p for i, p in enumerate(self._mapping_by_index) if p}
+        return self._mapping_cache
+
     def get_mapping(self) -> Dict[str, str]:
         return dict(self.mapping)
 
     def reset(self):
         self.db_path = None
         self.items = []
+        self._items_norm = []
         self.doc_ids = []
-        self.mapping.clear()
+        self._doc_id_to_rows = {}
+        self._clear_mapping()
         self._manual_mapped_docids.clear()
+        self._invalidate_used_cache()
         self.root_dir = None
+        self._root_real = None
+        self._fname_index = None
+        self._scan_generation += 1  # drop any scan still in flight
+        self._set_scan_busy(False)
         self._dup_for_selection.clear()
         self._dup_names.clear(); self._dup_paths.clear()
+        self._dup_paths_set_frozen = frozenset()
+        self._path_norm_cache = {}
         self._edit_mode = False
         self._edit_transmittal_number = None
         try:
-            self.tree.setRootIndex(self.model.index(self.model.rootPath()))
+            if self.model is not None:
+                self.model.setRootPath("")
+            self.tree.setModel(self._placeholder_model)
         except Exception:
             pass
-        self.tree.viewport().update()
+        self._schedule_tree_update()
 
     # ===== Internals =====
     def _normpath(self, p: str) -> str:
-        try:
-            return str(Path(p).resolve())
-        except Exception:
-            return str(Path(p))
+        p = os.fspath(p)
+        np = self._path_norm_cache.get(p)
+        if np is None:
+            np = self._path_norm_cache[p] = _realpath(p)
+        return np
 
     def _norm_rev(self, raw: str) -> str:
         """NEW: normalize 'Rev A' / ' a ' -> 'A'."""
@@ -425,20 +617,64 @@ class FilesTab(QWidget):
             r = r[3:].strip()
         return r
 
-    def _used_paths_set(self) -> set:
-        return {self._normpath(v) for v in self.mapping.values() if v}
+    def _mapped(self, doc_id: str) -> Optional[str]:
+        rows = self._doc_id_to_rows.get(doc_id)
+        return self._mapping_by_index[rows[0]] if rows else None
+
+    def _set_mapping(self, doc_id: str, np: str):
+        """Map doc_id -> normalised path (every row of it), keeping the reverse index in sync."""
+        rows = self._doc_id_to_rows.get(doc_id)
+        if not rows:
+            return
+        old = self._mapping_by_index[rows[0]]
+        if old and self._path_to_doc.get(old) == doc_id:
+            del self._path_to_doc[old]
+        for i in rows:
+            self._mapping_by_index[i] = np
+        self._path_to_doc[np] = doc_id
+        self._mapping_cache = None
+
+    def _pop_mapping(self, doc_id: str) -> Optional[str]:
+        rows = self._doc_id_to_rows.get(doc_id)
+        if not rows:
+            return None
+        old = self._mapping_by_index[rows[0]]
+        for i in rows:
+            self._mapping_by_index[i] = None
+        if old and self._path_to_doc.get(old) == doc_id:
+            del self._path_to_doc[old]
+        self._mapping_cache = None
+        return old
+
+    def _clear_mapping(self):
+        self._mapping_by_index = [None] * len(self.doc_ids)
+        self._path_to_doc.clear()
+        self._mapping_cache = None
+
+    def _invalidate_used_cache(self):
+        """Call after every mapping change and every change to self._manual_mapped_docids."""
+        self._used_paths_cache = None
+        self._manual_paths_cache = None
+
+    def _used_paths_set(self) -> frozenset:
+        if self._used_paths_cache is None:
+            # values are stored normalised
+            self._used_paths_cache = frozenset(p for p in self._mapping_by_index if p)
+        return self._used_paths_cache
 
     # --- NEW: helpers for manual tinting ---
-    def _manual_paths_set(self) -> set:
-        out = set()
-        try:
-            for d in self._manual_mapped_docids:
-                p = self.mapping.get(d)
-                if p:
-                    out.add(self._normpath(p))
-        except Exception:
-            pass
-        return out
+    def _manual_paths_set(self) -> frozenset:
+        if self._manual_paths_cache is None:
+            out = set()
+            try:
+                for d in self._manual_mapped_docids:
+                    p = self._mapped(d)
+                    if p:
+                        out.add(p)
+            except Exception:
+                pass
+            self._manual_paths_cache = frozenset(out)
+        return self._manual_paths_cache
 
     def _is_manual_mapped_path(self, p: str) -> bool:
         try:
@@ -447,33 +683,51 @@ class FilesTab(QWidget):
             return False
 
     def _find_doc_for_path(self, p: str) -> Optional[str]:
-        np = self._normpath(p)
-        for d, v in self.mapping.items():
-            if self._normpath(v) == np:
-                return d
-        return None
+        return self._path_to_doc.get(self._normpath(p))
+
+    def _normalise_items(self, items: List[dict]) -> List[dict]:
+        """Extract doc_id/revision from each payload item once (dicts or attribute objects)."""
+        norm_rev = self._norm_rev
+        out: List[dict] = []
+        for it in items:
+            did = _item_field(it, "doc_id") or ""
+            rv = (_item_field(it, "revision") or _item_field(it, "latest_rev_token")
+                  or _item_field(it, "latest_rev") or _item_field(it, "rev") or "")
+            out.append({"doc_id": did, "revision": norm_rev(rv), "item": it})
+        return out
 
     def _doc_rev_pairs(self) -> List[Tuple[str, str]]:
-        pairs: List[Tuple[str, str]] = []
-        for it in self.items:
-            did = (it.get("doc_id") or "").strip()
-            rv = (it.get("revision") or it.get("latest_rev_token") or it.get("latest_rev") or it.get("rev") or "").strip()
-            rv = self._norm_rev(rv)
-            if did and rv:
-                pairs.append((did, rv))
-        return pairs
+        return [
+            (did, n["revision"])
+            for n in self._items_norm
+            if (did := n["doc_id"].strip()) and n["revision"]
+        ]
 
     def _display_path(self, p: Optional[str]) -> str:
+        """Label for a mapped path. `p` is stored normalised (realpath), so it is compared
+        to the cached root realpath as-is: no filesystem calls per row."""
         if not p:
             return "—"
         try:
-            P = Path(p)
             if self.root_dir:
-                return str(P.resolve().relative_to(self.root_dir.resolve()))
-            return str(P.name)
+                root = self._root_real or os.path.realpath(self.root_dir)
+                rel = os.path.relpath(p, root)
+                if rel == os.pardir or rel.startswith(os.pardir + os.sep):
+                    return str(p)  # outside the root: show it in full
+                return rel
+            return os.path.basename(p)
         except Exception:
             return str(p)
 
+    def _filename_index(self):
+        """Filename index for the current root; walked once and reused by every auto-find."""
+        if self._fname_index is None and self.root_dir and FilenameIndex is not None:
+            try:
+                self._fname_index = FilenameIndex([self.root_dir])
+            except Exception:
+                self._fname_index = None
+        return self._fname_index
+
     def _current_doc_id(self) -> Optional[str]:
         row = self.list_docs.currentRow()
         if 0 <= row < len(self.doc_ids):
@@ -481,78 +735,115 @@ class FilesTab(QWidget):
         return None
 
     # ===== Refresh & coloring =====
+    def _sync_list(self, widget: QListWidget, items: List[QListWidgetItem],
+                   texts: List[str], labels: List[str]):
+        """Bring `widget` in line with `labels`, reusing live items when the row count is unchanged."""
+        # One relayout/repaint at the end instead of one per row
+        widget.setUpdatesEnabled(False)
+        widget.blockSignals(True)
+        try:
+            if len(items) == len(labels) == widget.count():
+                for i, label in enumerate(labels):
+                    if texts[i] != label:
+                        items[i].setText(label)
+                        texts[i] = label
+                return
+            widget.clear()
+            widget.addItems(labels)
+            items[:] = [widget.item(i) for i in range(widget.count())]
+            texts[:] = labels
+        finally:
+            widget.blockSignals(False)
+            widget.setUpdatesEnabled(True)
+
     def _refresh_doc_list(self):
-        self.list_docs.clear()
-        # Build {doc_id -> revision} for nicer labels
-        rev_lookup: Dict[str, str] = {}
-        for it in (self.items or []):
-            did = (it.get("doc_id") if isinstance(it, dict) else getattr(it, "doc_id", "")) or ""
-            rev = ""
-            if isinstance(it, dict):
-                rev = (it.get("revision") or it.get("latest_rev_token") or it.get("latest_rev") or it.get("rev") or "").strip()
-            else:
-                rev = (getattr(it, "revision", "") or getattr(it, "latest_rev_token", "") or getattr(it, "latest_rev", "") or getattr(it, "rev", "") or "").strip()
-            if did:
-                rev_lookup[did] = rev
-        for d in self.doc_ids:
-            rv = rev_lookup.get(d, "")
-            label = f"{d}  —  Rev {self._norm_rev(rv)}" if rv else d
-            self.list_docs.addItem(QListWidgetItem(label))
-        self._apply_colors()
+        labels = [
+            f"{n['doc_id']}  —  Rev {n['revision']}" if n["doc_id"] and n["revision"] else n["doc_id"]
+            for n in self._items_norm
+        ]
+        self._sync_list(self.list_docs, self._doc_items, self._doc_texts, labels)
+        if not self._suspend_colors:
+            self._apply_colors()
 
     def _refresh_map_list(self):
-        self.list_map.clear()
-        for d in self.doc_ids:
-            p = self.mapping.get(d)
-            it = QListWidgetItem(self._display_path(p))
-            if p:
-                if self._is_manual_mapped_path(p):
-                    it.setForeground(QBrush(getattr(self, "_green_manual", QColor(38, 185, 110))))
-                elif self._is_duplicate_basename(p):
-                    it.setForeground(QBrush(QColor(210, 130, 10)))  # amber
-                else:
-                    it.setForeground(QBrush(getattr(self, "_green_auto", QColor(46, 160, 67))))
-            else:
-                it.setForeground(QBrush(QColor(200, 60, 60)))  # red
-            self.list_map.addItem(it)
-        # Keep doc list in sync
-        self._apply_colors()
+        self._refresh_map_texts()
+        if not self._suspend_colors:
+            self._apply_colors()
+
+    def _refresh_map_texts(self):
+        """Sync the mapped-files labels only; callers decide how to recolour."""
+        labels = [self._display_path(p) for p in self._mapping_by_index]
+        self._sync_list(self.list_map, self._map_items, self._map_texts, labels)
+
+    def _brush_for(self, mapped_path: Optional[str]) -> QBrush:
+        if not mapped_path:
+            return self._BRUSH_RED
+        if self._is_manual_mapped_path(mapped_path):
+            return self._BRUSH_GREEN_MANUAL  # manual overrides duplicate
+        if self._is_duplicate_path(mapped_path):
+            return self._BRUSH_AMBER
+        return self._BRUSH_GREEN_AUTO
+
+    def _apply_color_for_index(self, i: int):
+        """Recolour row i of both lists (Files for transmittal + Mapped files)."""
+        if not (0 <= i < len(self._mapping_by_index)):
+            return
+        brush = self._brush_for(self._mapping_by_index[i])
+        it_mid = self.list_docs.item(i)
+        if it_mid:
+            it_mid.setForeground(brush)
+        it_right = self.list_map.item(i)
+        if it_right:
+            it_right.setForeground(brush)
 
     def _apply_colors(self):
-        green_auto = QBrush(getattr(self, "_green_auto", QColor(46, 160, 67)))
-        green_manual = QBrush(getattr(self, "_green_manual", QColor(38, 185, 110)))
-        red = QBrush(QColor(200, 60, 60))
-        amber = QBrush(QColor(210, 130, 10))
+        for i in range(len(self.doc_ids)):
+            self._apply_color_for_index(i)
+        self._schedule_tree_update()
 
-        for i, d in enumerate(self.doc_ids):
-            mapped_path = self.mapping.get(d)
-
-            # Middle list (Files for transmittal)
-            it_mid = self.list_docs.item(i)
-            if it_mid:
-                if mapped_path:
-                    if self._is_manual_mapped_path(mapped_path):
-                        it_mid.setForeground(green_manual)  # manual overrides duplicate
-                    elif self._is_duplicate_basename(mapped_path):
-                        it_mid.setForeground(amber)
-                    else:
-                        it_mid.setForeground(green_auto)
-                else:
-                    it_mid.setForeground(red)
-
-            # Right list (Mapped files)
-            it_right = self.list_map.item(i)
-            if it_right:
-                if mapped_path:
-                    if self._is_manual_mapped_path(mapped_path):
-                        it_right.setForeground(green_manual)  # manual overrides duplicate
-                    elif self._is_duplicate_basename(mapped_path):
-                        it_right.setForeground(amber)
-                    else:
-                        it_right.setForeground(green_auto)
-                else:
-                    it_right.setForeground(red)
+    def _schedule_color_refresh(self):
+        """Queue one full _apply_colors for the next event-loop turn (multi-row changes)."""
+        if self._pending_color_refresh:
+            return
+        self._pending_color_refresh = True
+        QTimer.singleShot(0, self._flush_color_refresh)
+
+    def _flush_color_refresh(self):
+        self._pending_color_refresh = False
+        self._apply_colors()
 
+    def _fs_model(self) -> LazyFsModel:
+        """Create the file tree model on first use and make sure the tree shows it."""
+        if self.model is None:
+            # Lazy, read-only: each folder is listed only when it is expanded
+            self.model = LazyFsModel(self)
+        if self.tree.model() is not self.model:
+            self.tree.setModel(self.model)
+        return self.model
+
+    def _update_tree_paths(self, paths):
+        """Repaint only the tree rows for `paths` (e.g. after a single mapping change)."""
+        for p in paths:
+            if not p:
+                continue
+            try:
+                if self.model is None:
+                    return
+                idx = self.model.index_for_path(p)
+                if idx.isValid():
+                    self.tree.update(idx)
+            except Exception:
+                pass
+
+    def _schedule_tree_update(self):
+        """Queue one tree repaint; repeated calls in the same event-loop turn coalesce."""
+        if self._tree_update_pending:
+            return
+        self._tree_update_pending = True
+        QTimer.singleShot(0, self._do_tree_update)
+
+    def _do_tree_update(self):
+        self._tree_update_pending = False
         self.tree.viewport().update()
 
     # ===== Duplicate detection =====
@@ -601,70 +892,85 @@ class FilesTab(QWidget):
             <DocID>_<REV>.*, <DocID>-<REV>.*, <DocID> <REV>.*
         (case-insensitive)
         """
-        import re
+        self._scan_generation += 1
+        self._set_scan_busy(False)
         self._dup_for_selection.clear()
         self._dup_names = set()
         self._dup_paths = set()
+        self._dup_paths_set_frozen = frozenset()
+        self._path_norm_cache = {}
+        # Duplicate flags were just dropped: recolour in place (list contents are unchanged)
+        self._apply_colors()
 
         if not self.root_dir:
             self._update_dup_banner(0)
-            self.tree.viewport().update()
             return
 
         pairs = self._doc_rev_pairs()
         if not pairs:
             self._update_dup_banner(0)
-            self.tree.viewport().update()
             return
 
-        # Compile per-DocID target regexes
-        targets: Dict[str, List[re.Pattern]] = {}
-        for did, rv in pairs:
-            if not did or not rv:
-                continue
-            bases = {f"{did}_{rv}", f"{did}-{rv}", f"{did} {rv}"}
-            targets[did] = [re.compile(rf"^{re.escape(b)}\.[A-Za-z0-9]+$", re.IGNORECASE) for b in bases]
+        # Walk once off the UI thread; _on_dup_scan_done picks up the result
+        task = _DupScanTask(self._scan_generation, str(self.root_dir), pairs)
+        task.signals.partial.connect(self._on_dup_scan_progress)
+        task.signals.finished.connect(self._on_dup_scan_done)
+        self._dup_scan_task = task  # keep the wrapper (and its signals) alive until it reports
+        self._set_scan_busy(True)
+        QThreadPool.globalInstance().start(task)
 
-        # Walk once, bucket matches against targets
-        hits: Dict[str, List[str]] = {did: [] for did, _ in pairs}
+    def _on_dup_scan_progress(self, generation: int, seen: int, found: int):
+        if generation != self._scan_generation:
+            return
         try:
-            for p in self.root_dir.rglob("*"):
-                if not p.is_file():
-                    continue
-                name = p.name
-                np = self._normpath(str(p))
-                for did, regs in targets.items():
-                    if any(rx.match(name) for rx in regs):
-                        hits.setdefault(did, []).append(np)
+            self.lbl_dups.setText(f"⚠ Duplicates found so far: {found} (scanning…)")
+            self.lbl_dups.setToolTip(f"{seen:,} files checked")
+            self.lbl_dups.setVisible(True)
         except Exception:
             pass
 
-        # Keep only true duplicates (more than one match for that DocID+Rev)
-        self._dup_for_selection = {did: paths for did, paths in hits.items() if len(paths) > 1}
+    def _on_dup_scan_done(self, generation: int, hits: Dict[str, List[str]], norm: Dict[str, str]):
+        if generation != self._scan_generation:
+            return  # root changed (or tab reset) since this scan started
+        self._dup_scan_task = None
+        self._path_norm_cache = norm or {}
+        self._set_scan_busy(False)
+
+        # hits only holds true duplicates (more than one match for that DocID+Rev);
+        # only these few paths are normalised
+        self._dup_for_selection = {
+            did: [self._normpath(p) for p in paths]
+            for did, paths in hits.items()
+        }
         for paths in self._dup_for_selection.values():
             for np in paths:
                 self._dup_paths.add(np)
-                try:
-                    self._dup_names.add(Path(np).name.lower())
-                except Exception:
-                    pass
+                self._dup_names.add(os.path.basename(np).lower())
+        self._dup_paths_set_frozen = frozenset(self._dup_paths)
 
         # Banner shows number of DocIDs with duplicates
         self._update_dup_banner(len(self._dup_for_selection))
-        self._refresh_map_list()
-        self.tree.viewport().update()
+        self._apply_colors()  # also queues the tree repaint
 
-    def _is_duplicate_basename(self, p: str) -> bool:
-        """True only if this file is part of a duplicate set for one of the selected DocIDs."""
+    def _set_scan_busy(self, busy: bool):
+        """Auto-match relies on the duplicate sets, so hold it off while a scan runs."""
+        self.btn_auto_exact.setEnabled(not busy)
+        self.btn_auto_fuzzy.setEnabled(not busy)
+
+    def _is_duplicate_path(self, p: str) -> bool:
+        """Normalise one path and test it against the duplicate sets of the selected DocIDs."""
+        dups = self._dup_paths_set_frozen
+        if not dups:
+            return False
         try:
-            name = Path(p).name.lower()
-            return name in getattr(self, "_dup_names", set())
+            return self._normpath(p) in dups
         except Exception:
             return False
 
     def _update_dup_banner(self, total: int):
         try:
             if hasattr(self, "lbl_dups"):
+                self.lbl_dups.setToolTip("")
                 if total > 0:
                     self.lbl_dups.setText(f"⚠ Duplicates (selected docs): {total}")
                     self.lbl_dups.setVisible(True)
@@ -679,11 +985,13 @@ class FilesTab(QWidget):
             return
         try:
             self.root_dir = Path(folder)
-            self.tree.setRootIndex(self.model.index(str(self.root_dir)))
+            self._root_real = os.path.realpath(self.root_dir)
+            self._fname_index = None
+            self.tree.setRootIndex(self._fs_model().setRootPath(str(self.root_dir)))
         except Exception:
             pass
-        self._scan_duplicates()     # scan + banner + repaint
-        self._refresh_map_list()    # relative path display against new root
+        self._refresh_map_texts()   # relative path display against new root
+        self._scan_duplicates()     # scan + banner + recolour + repaint
 
     # ===== Actions =====
     def _choose_root(self):
@@ -691,23 +999,25 @@ class FilesTab(QWidget):
         if not path:
             return
         self.root_dir = Path(path)
+        self._root_real = os.path.realpath(self.root_dir)
+        self._fname_index = None
         try:
-            self.tree.setRootIndex(self.model.index(str(self.root_dir)))
+            self.tree.setRootIndex(self._fs_model().setRootPath(str(self.root_dir)))
         except Exception:
             pass
+        self._refresh_map_texts()
         self._scan_duplicates()
-        self._refresh_map_list()
 
     def _on_drop_map_to_doc(self, row: int, file_path: str):
         try:
-            p = Path(file_path)
-            if not (p.exists() and p.is_file()):
+            if not os.path.isfile(file_path):
                 QMessageBox.warning(self, "Invalid file", f"'{file_path}' is not a file.")
                 return
-            np = self._normpath(str(p))
+            name = os.path.basename(file_path)
+            np = self._normpath(file_path)
             doc_id = self.doc_ids[row]
             # Duplicate basename warning (manual mapping allowed)
-            if self._is_duplicate_basename(np):
+            if self._is_duplicate_path(np):
                 r = QMessageBox.warning(
                     self, "Duplicate filename",
                     "This filename appears multiple times under the root for the current submission.\n\n"
@@ -723,28 +1033,35 @@ class FilesTab(QWidget):
             if current_owner and current_owner != doc_id:
                 r = QMessageBox.question(
                     self, "Reassign mapping?",
-                    f"'{p.name}' is already mapped to {current_owner}.\n"
+                    f"'{name}' is already mapped to {current_owner}.\n"
                     f"Reassign to {doc_id}?",
                     QMessageBox.Yes | QMessageBox.No, QMessageBox.No
                 )
                 if r != QMessageBox.Yes:
                     return
-                self.mapping.pop(current_owner, None)
-                self._refresh_map_list()
+                self._pop_mapping(current_owner)
+                self._invalidate_used_cache()
                 try: toast(self, f"Reassigned to {doc_id}")
                 except Exception: pass
             # Assign
-            self.mapping[doc_id] = np
+            prev = self._mapped(doc_id)
+            self._set_mapping(doc_id, np)
             # mark this doc as manual; if we stole it from someone else, clear theirs
             self._manual_mapped_docids.discard(self._find_doc_for_path(np) or "")  # just in case
             self._manual_mapped_docids.add(doc_id)
-            self._refresh_map_list()
-            try: self._apply_colors()
-            except Exception: pass
+            self._invalidate_used_cache()
+            # Only the target's rows (and a previous owner's) changed
+            self._refresh_map_texts()
+            for i in self._doc_id_to_rows.get(doc_id, ()):
+                self._apply_color_for_index(i)
+            if current_owner and current_owner != doc_id:
+                for i in self._doc_id_to_rows.get(current_owner, ()):
+                    self._apply_color_for_index(i)
+            self._update_tree_paths((prev, np))
             # SUCCESS TOAST
             try:
-                if self._is_duplicate_basename(np):
-                    toast(self, f"Assigned (duplicate): {p.name}")
+                if self._is_duplicate_path(np):
+                    toast(self, f"Assigned (duplicate): {name}")
                 else:
                     toast(self, f"Assigned to {doc_id}")
             except Exception:
@@ -753,15 +1070,23 @@ class FilesTab(QWidget):
             QMessageBox.critical(self, "Drop failed", f"{type(ex).__name__}: {ex}")
 
     def _clear_all(self):
-        self.mapping.clear()
+        self._clear_mapping()
         self._manual_mapped_docids.clear()
-        self._refresh_map_list()
+        self._invalidate_used_cache()
+        self._refresh_map_texts()
+        self._schedule_color_refresh()
 
     # NEW: helper to find <DocID>_latestRev.* under root (case-insensitive)
     def _find_latestrev_file(self, doc_id: str) -> Optional[Path]:
         if not self.root_dir or not doc_id:
             return None
         base_lower = f"{doc_id}_latestrev"
+        index = self._filename_index()
+        if index is not None:
+            for p, _name, _stem, ext in index.lookup_stem(base_lower):
+                if ext:
+                    return Path(p)
+            return None
         try:
             for p in self.root_dir.rglob("*"):
                 if p.is_file() and p.suffix and p.stem.lower() == base_lower.lower():
@@ -777,7 +1102,8 @@ class FilesTab(QWidget):
 
         pairs = self._doc_rev_pairs()
         try:
-            found = find_docid_rev_matches(pairs, [self.root_dir], extensions=None) or {}
+            found = find_docid_rev_matches(pairs, [self.root_dir], extensions=None,
+                                           index=self._filename_index()) or {}
         except Exception:
             found = {}
 
@@ -791,30 +1117,34 @@ class FilesTab(QWidget):
         assigned = 0
         skipped_conflict = 0
         skipped_dups = 0
-        used = self._used_paths_set()
+        used = set(self._used_paths_set())
+        dups = self._dup_paths_set_frozen
+        path_to_doc = self._path_to_doc
         for d in self.doc_ids:
             p = found.get(d)
             if not p:
                 continue
-            if self._is_duplicate_basename(str(p)):
+            np = self._normpath(str(p))  # scan-cache hit for files under root
+            if np in dups:
                 skipped_dups += 1
                 continue
-            np = self._normpath(str(p))
-            current_owner = self._find_doc_for_path(np)
+            current_owner = path_to_doc.get(np)
             if current_owner and current_owner != d:
                 skipped_conflict += 1
                 continue
-            prev = self.mapping.get(d)
+            prev = self._mapped(d)
             if prev:
-                used.discard(self._normpath(prev))
+                used.discard(prev)  # mapping values are already normalised
             if np not in used or current_owner == d:
-                self.mapping[d] = np
+                self._set_mapping(d, np)
                 self._manual_mapped_docids.discard(d)  # auto → not manual
                 used.add(np)
                 assigned += 1
             else:
                 skipped_conflict += 1
-        self._refresh_map_list()
+        self._invalidate_used_cache()
+        self._refresh_map_texts()
+        self._schedule_color_refresh()
         try:
             toast(self, f"Exact: {assigned} assigned, {skipped_conflict} conflicts, {skipped_dups} duplicates")
         except Exception:
@@ -832,36 +1162,40 @@ class FilesTab(QWidget):
             QMessageBox.information(self, "Pick a root", "Choose a root folder first.")
             return
         try:
-            guessed = suggest_mapping(self.doc_ids, [self.root_dir]) or {}
+            guessed = suggest_mapping(self.doc_ids, [self.root_dir], index=self._filename_index()) or {}
         except Exception:
             guessed = {}
         assigned = 0
         skipped_conflict = 0
         skipped_dups = 0
-        used = self._used_paths_set()
+        used = set(self._used_paths_set())
+        dups = self._dup_paths_set_frozen
+        path_to_doc = self._path_to_doc
         for d in self.doc_ids:
             lst = guessed.get(d) or []
             if not lst:
                 continue
             candidate_path = lst[0][0]
-            if self._is_duplicate_basename(str(candidate_path)):
+            np = self._normpath(str(candidate_path))  # scan-cache hit for files under root
+            if np in dups:
                 skipped_dups += 1
                 continue
-            np = self._normpath(str(candidate_path))
-            current_owner = self._find_doc_for_path(np)
+            current_owner = path_to_doc.get(np)
             if current_owner and current_owner != d:
                 skipped_conflict += 1
                 continue
-            prev = self.mapping.get(d)
+            prev = self._mapped(d)
             if prev:
-                used.discard(self._normpath(prev))
+                used.discard(prev)  # mapping values are already normalised
             if np not in used or current_owner == d:
-                self.mapping[d] = np
+                self._set_mapping(d, np)
                 used.add(np)
                 assigned += 1
             else:
                 skipped_conflict += 1
-        self._refresh_map_list()
+        self._invalidate_used_cache()
+        self._refresh_map_texts()
+        self._schedule_color_refresh()
         try:
             toast(self, f"Fuzzy: {assigned} assigned, {skipped_conflict} conflicts, {skipped_dups} duplicates")
         except Exception:
@@ -876,20 +1210,20 @@ class FilesTab(QWidget):
 
     # ===== Snapshot & Proceed =====
     def _build_snapshot_items(self) -> List[dict]:
+        # Only the fields the services read; "file_path" is the mapped path.
         snap: List[dict] = []
-        for it in (self.items or []):
-            did = (it.get("doc_id") if isinstance(it, dict) else getattr(it, "doc_id", "")) or ""
-            if not did:
+        for n, p in zip(self._items_norm, self._mapping_by_index):
+            if not n["doc_id"].strip():
                 continue
-            p = self.mapping.get(did)
-            snap.append({
-                "doc_id": did,
-                "description": (it.get("description") if isinstance(it, dict) else getattr(it, "description", "")) or "",
-                "type": (it.get("type") if isinstance(it, dict) else getattr(it, "type", "")) or "",
-                "file_type": (it.get("file_type") if isinstance(it, dict) else getattr(it, "file_type", "")) or "",
-                "revision": (it.get("revision") if isinstance(it, dict) else getattr(it, "revision", "")) or "",
-                "file_path": p or "",   # <— key expected by the service
-            })
+            it = n["item"]
+            s = {"doc_id": n["doc_id"],
+                 "revision": _item_field(it, "revision") or n["revision"],
+                 "file_path": p or ""}
+            for k in _SNAPSHOT_FIELDS:
+                v = _item_field(it, k)
+                if v is not None:
+                    s[k] = v
+            snap.append(s)
         return snap
 
     def _proceed_build_transmittal(self):
@@ -901,7 +1235,7 @@ class FilesTab(QWidget):
         unmapped = [s for s in snap if not s.get("file_path")] \
                    + [s for s in snap
                       if s.get("file_path")
-                      and self._is_duplicate_basename(s.get("file_path"))
+                      and self._is_duplicate_path(s.get("file_path"))
                       and not self._is_manual_mapped_path(s.get("file_path"))]
         if unmapped:
             names = "\n".join(f"• {s['doc_id']}" for s in unmapped[:8])
@@ -931,6 +1265,7 @@ class FilesTab(QWidget):
             except Exception as e:
                 QMessageBox.critical(self, "Remap", f"Failed to update transmittal:\n{e}")
                 return
+            self._fname_index = None  # the bundle copy may have landed under root_dir
             QMessageBox.information(
                 self, "Remap complete",
                 f"Updated {self._edit_transmittal_number} and rebuilt.\n\n{trans_dir}"
@@ -951,6 +1286,7 @@ class FilesTab(QWidget):
         except Exception as e:
             QMessageBox.critical(self, "Transmittal", f"Failed to create transmittal:\n{e}")
             return
+        self._fname_index = None  # the bundle copy may have landed under root_dir
         QMessageBox.information(
             self, "Transmittal created",
             f"Your transmittal has been created:\n\n{trans_dir}\n\n"
@@ -994,7 +1330,7 @@ class FilesTab(QWidget):
         unmapped = [s for s in snap if not s.get("file_path")] \
                    + [s for s in snap
                       if s.get("file_path")
-                      and self._is_duplicate_basename(s.get("file_path"))
+                      and self._is_duplicate_path(s.get("file_path"))
                       and not self._is_manual_mapped_path(s.get("file_path"))]
 
         if unmapped:
@@ -1070,6 +1406,10 @@ class FilesTab(QWidget):
         cp_code = (result or {}).get("code", "")
         cp_dir = (result or {}).get("dir", "")
 
+        # Mapped sources were renamed to *_CP_N: re-list the tree, filename index and duplicates
+        if self.root_dir:
+            self.set_root_folder(self.root_dir)
+
         QMessageBox.information(
             self,
             "CheckPrint Started",
@@ -1081,7 +1421,7 @@ class FilesTab(QWidget):
         # Refresh CheckPrint tab so the new batch appears immediately
         try:
             mw = self.window()  # MainWindow
-            if hasattr(mw, "checkprint_tab"):
+            if getattr(mw, "checkprint_tab", None) is not None:  # None until first opened
                 mw.checkprint_tab._reload_batches()
         except Exception as e:
             print("Failed to refresh CheckPrint tab:", e)
@@ -1,13 +1,18 @@
 from __future__ import annotations
 from pathlib import Path
+from datetime import datetime
 from typing import List, Dict, Optional
 import traceback
 
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal, QObject, QRunnable, QThreadPool, QTimer, QSignalBlocker
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QSplitter, QGroupBox,
-    QTableWidget, QTableWidgetItem, QPushButton, QMessageBox, QLabel,
-    QComboBox, QLineEdit
+    QTableView, QPushButton, QMessageBox, QLabel,
+    QComboBox, QLineEdit, QHeaderView
+)
+
+from .widgets.history_model import (
+    HistoryRowsModel, LEFT_HEADERS, LEFT_KEYS, RIGHT_HEADERS, RIGHT_KEYS,
 )
 
 from ..services.transmittal_service import (
@@ -31,24 +36,76 @@ except Exception:
     from ..services.db import init_db, get_project, list_transmittals, get_transmittal_items  # type: ignore
     list_documents_with_latest = None  # type: ignore
 
-try:
-    from ..services.transmittal_service import (
-        rebuild_transmittal_bundle,
-        edit_transmittal_add_items,
-        edit_transmittal_remove_items,
-        edit_transmittal_update_header,
-        soft_delete_transmittal_bundle,
-        purge_transmittal_bundle,
-    )
-except Exception:
-    from ..transmittal_service import (  # type: ignore
-        rebuild_transmittal_bundle,
-        edit_transmittal_add_items,
-        edit_transmittal_remove_items,
-        edit_transmittal_update_header,
-        soft_delete_transmittal_bundle,
-        purge_transmittal_bundle,
-    )
+# Fixed starting widths (px); sizing to contents would walk every row on each refresh.
+# Columns stay user-resizable (double-click a divider to fit one column).
+LEFT_COL_WIDTHS = [140, 70, 80, 90, 320, 70]
+RIGHT_COL_WIDTHS = [140, 70, 80, 90, 280, 70, 400]
+
+
+def _canon(s) -> str:
+    return (s or "").strip()
+
+
+def _with_cid(rows: Optional[List[dict]]) -> List[dict]:
+    """Store the canonical doc_id on each row once (as "_cid") so diffs need no string work."""
+    rows = rows or []
+    for r in rows:
+        r["_cid"] = _canon(r.get("doc_id"))
+    return rows
+
+
+class _LoadSignals(QObject):
+    # (generation, right items or None, left rows or None, register rows if freshly read)
+    finished = pyqtSignal(int, object, object, object)
+
+
+class _LoadTask(QRunnable):
+    """
+    Reads a transmittal's items and the register rows not in it on the global thread
+    pool. Every db helper opens its own SQLite connection, so this is safe off the
+    GUI thread. With load_items=False only the left pane is re-read (against
+    right_ids); with load_left=False the left pane is skipped and reported as None.
+    register: the cached active register rows, or None to read them here.
+    """
+    def __init__(self, generation: int, db_path: Path, tid: Optional[int],
+                 project_id: Optional[int], load_items: bool = True, load_left: bool = True,
+                 register: Optional[List[dict]] = None, right_ids: frozenset = frozenset()):
+        super().__init__()
+        self.signals = _LoadSignals()
+        self._generation = generation
+        self._db_path = db_path
+        self._tid = tid
+        self._project_id = project_id
+        self._load_items = load_items
+        self._load_left = load_left
+        self._register = register
+        self._right_ids = right_ids
+
+    def run(self):
+        items: Optional[List[dict]] = None
+        left: Optional[List[dict]] = None
+        fresh: Optional[List[dict]] = None  # register rows read here, for the tab's cache
+        if self._load_items:
+            items = []
+            try:
+                if self._tid is not None:
+                    items = _with_cid(get_transmittal_items(self._db_path, self._tid))
+            except Exception:
+                print("[HistoryTab] load items error:\n" + traceback.format_exc(), flush=True)
+        if self._load_left:
+            left = []
+        if self._load_left and self._project_id and list_documents_with_latest:
+            try:
+                register = self._register
+                if register is None:
+                    register = fresh = _with_cid(list_documents_with_latest(
+                        self._db_path, self._project_id, state="active"))
+                # register MINUS transmittal
+                right_ids = {it["_cid"] for it in items} if items is not None else self._right_ids
+                left = [r for r in register if r["_cid"] and r["_cid"] not in right_ids]
+            except Exception:
+                print("[HistoryTab] load register error:\n" + traceback.format_exc(), flush=True)
+        self.signals.finished.emit(self._generation, items, left, fresh)
 
 
 class HistoryTab(QWidget):
@@ -67,17 +124,36 @@ class HistoryTab(QWidget):
         super().__init__(parent)
         self.db_path: Optional[Path] = None
         self.project_id: Optional[int] = None
+        self._project: dict = {}  # get_project() row, read once per refresh()
         self._headers: List[dict] = []
         self._current_header: Optional[dict] = None
         self._items_right: List[dict] = []   # items in transmittal
+        self._right_ids: set[str] = set()    # _cid of every right-hand row, kept in step with _items_right
+        # Fingerprints of what each table currently shows; unchanged data is not re-rendered
+        self._left_fp: Optional[int] = None
+        self._right_fp: Optional[int] = None
         self._items_left: List[dict] = []    # register - right
+        # Active register rows; fixed while only the transmittal selection changes.
+        # Cleared by refresh() (Reload, DB change, delete/purge) and invalidate_register()
+        # (MainWindow, each time the History tab becomes current).
+        self._register_cache: Optional[List[dict]] = None
+        # Left pane is only read while it is on screen; True = not loaded for this selection
+        self._items_left_dirty: bool = True
+        # Bumped per selection; results from older background loads are dropped
+        self._load_generation: int = 0
+        self._load_task: Optional[_LoadTask] = None
 
         root = QVBoxLayout(self)
 
         # --- Top: transmittal selector ---
         top = QHBoxLayout()
         self.cb_trans = QComboBox(self)
-        self.cb_trans.currentIndexChanged.connect(self._on_transmittal_changed)
+        # Arrowing through the list restarts the timer; only the settled selection loads
+        self._load_timer = QTimer(self)
+        self._load_timer.setSingleShot(True)
+        self._load_timer.setInterval(150)
+        self._load_timer.timeout.connect(lambda: self._on_transmittal_changed(self.cb_trans.currentIndex()))
+        self.cb_trans.currentIndexChanged.connect(self._schedule_load)
         self.btn_reload = QPushButton("Reload", self); self.btn_reload.clicked.connect(self.refresh)
         self.lbl_sel = QLabel("No transmittal selected", self)
 
@@ -115,26 +191,26 @@ class HistoryTab(QWidget):
         # LEFT: Register (available)
         gb_left = QGroupBox("Register (available)", self)
         left_l = QVBoxLayout(gb_left)
-        self.tbl_left = QTableWidget(0, 6, gb_left)
-        self.tbl_left.setHorizontalHeaderLabels(
-            ["Doc ID", "Revision", "Type", "Status", "Description", "File Type"]
-        )
+        self.left_model = HistoryRowsModel(LEFT_HEADERS, LEFT_KEYS, self)
+        self.tbl_left = QTableView(gb_left)
+        self.tbl_left.setModel(self.left_model)
         self.tbl_left.setSelectionBehavior(self.tbl_left.SelectRows)
         left_l.addWidget(self.tbl_left, 1)
 
         add_row = QHBoxLayout()
+        self.btn_load_left = QPushButton("Load available", gb_left)
+        self.btn_load_left.clicked.connect(lambda: self._ensure_left_loaded(force=True))
         self.btn_add = QPushButton("Add →", gb_left); self.btn_add.clicked.connect(self._add_selected)
-        add_row.addStretch(1); add_row.addWidget(self.btn_add)
+        add_row.addWidget(self.btn_load_left); add_row.addStretch(1); add_row.addWidget(self.btn_add)
         left_l.addLayout(add_row)
         split.addWidget(gb_left)
 
         # RIGHT: Transmittal items
         gb_right = QGroupBox("Transmittal items", self)
         right_l = QVBoxLayout(gb_right)
-        self.tbl_right = QTableWidget(0, 7, gb_right)
-        self.tbl_right.setHorizontalHeaderLabels(
-            ["Doc ID", "Revision", "Type", "Status", "Description", "File Type", "File Path"]
-        )
+        self.right_model = HistoryRowsModel(RIGHT_HEADERS, RIGHT_KEYS, self)
+        self.tbl_right = QTableView(gb_right)
+        self.tbl_right.setModel(self.right_model)
         self.tbl_right.setSelectionBehavior(self.tbl_right.SelectRows)
         right_l.addWidget(self.tbl_right, 1)
 
@@ -153,10 +229,23 @@ class HistoryTab(QWidget):
 
         split.addWidget(gb_right)
         split.setStretchFactor(0, 1); split.setStretchFactor(1, 2)
+        self._split = split
+        # Dragging a collapsed left pane open loads it
+        split.splitterMoved.connect(lambda *_: self._ensure_left_loaded())
+
+        for tbl, widths in ((self.tbl_left, LEFT_COL_WIDTHS), (self.tbl_right, RIGHT_COL_WIDTHS)):
+            tbl.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+            for i, w in enumerate(widths):
+                tbl.setColumnWidth(i, w)
 
         # UX
-        self.tbl_left.itemDoubleClicked.connect(lambda _: self._add_selected())
-        self.tbl_right.itemDoubleClicked.connect(lambda _: self._remove_selected())
+        self.tbl_left.doubleClicked.connect(lambda _: self._add_selected())
+        self.tbl_right.doubleClicked.connect(lambda _: self._remove_selected())
+
+    def showEvent(self, e):
+        super().showEvent(e)
+        # After the splitter has laid out, so the left pane's size is real
+        QTimer.singleShot(0, self._ensure_left_loaded)
 
     # -------- Public API --------
     def set_db_path(self, db_path: Path):
@@ -166,14 +255,21 @@ class HistoryTab(QWidget):
     def set_db(self, db_path: Path):
         self.set_db_path(db_path)
 
+    def invalidate_register(self):
+        """Drop the cached register rows (the Register tab may have changed them).
+        The left pane is re-read when next on screen."""
+        self._register_cache = None
+        self._items_left_dirty = True
+
     # -------- Refresh pipeline --------
     def refresh(self):
+        self._register_cache = None
         if not self.db_path:
             return
         try:
             init_db(self.db_path)
-            proj = get_project(self.db_path)
-            self.project_id = (proj or {}).get("id", None)
+            self._project = get_project(self.db_path) or {}
+            self.project_id = self._project.get("id", None)
             self._headers = list_transmittals(self.db_path, include_deleted=False) or []
 
             self.cb_trans.blockSignals(True)
@@ -186,23 +282,30 @@ class HistoryTab(QWidget):
                 self.cb_trans.setCurrentIndex(0)
                 self._on_transmittal_changed(0)
             else:
+                self._load_generation += 1  # drop any load still in flight
+                self._set_loading(False)
                 self._current_header = None
                 self.lbl_sel.setText("No transmittal selected")
                 self._items_right, self._items_left = [], []
+                self._right_ids = set()
                 self._render_tables()
 
         except Exception:
             print("[HistoryTab] refresh error:\n" + traceback.format_exc(), flush=True)
 
+    def _schedule_load(self, _idx: int = -1):
+        self._load_timer.start()
+
     def _on_transmittal_changed(self, idx: int):
+        self._load_timer.stop()  # a direct call supersedes any pending debounced one
         if idx < 0 or not self.db_path:
+            self._load_generation += 1  # drop any load still in flight
+            self._set_loading(False)
             self._current_header = None
             self.lbl_sel.setText("No transmittal selected")
             self._items_right, self._items_left = [], []
-            if hasattr(self, "le_date"):  self.le_date.setText("")
-            if hasattr(self, "le_title"): self.le_title.setText("")
-            if hasattr(self, "le_by"):    self.le_by.setText("")
-            if hasattr(self, "le_to"):    self.le_to.setText("")
+            self._right_ids = set()
+            self._prefill_header("", "", "", "")
             self._render_tables()
             return
 
@@ -210,105 +313,112 @@ class HistoryTab(QWidget):
         number = (self._current_header or {}).get("number", "—")
         self.lbl_sel.setText(f"Transmittal: {number}")
 
-        # Prefill date
+        # Prefill date / title / who by / to
+        hdr = self._current_header or {}
+        co = hdr.get("created_on", "") or ""
         try:
-            co = (self._current_header or {}).get("created_on", "") or ""
-            if len(co) >= 10 and co[4:5] == "-" and co[7:8] == "-":
-                from datetime import datetime as _dt
-                fmt_in = "%Y-%m-%d %H:%M" if ":" in co else "%Y-%m-%d"
-                dt = _dt.strptime(co, fmt_in)
-                co = dt.strftime("%d/%m/%Y %H:%M") if ":" in co else dt.strftime("%d/%m/%Y")
-            if hasattr(self, "le_date"):
-                self.le_date.setText(co)
-            # Prefill title / who by
-            try:
-                if hasattr(self, "le_date"):  self.le_date.setText(co)
-                if hasattr(self, "le_title"): self.le_title.setText((self._current_header or {}).get("title", "") or "")
-                if hasattr(self, "le_by"):    self.le_by.setText(
-                    (self._current_header or {}).get("created_by", "") or "")
-                if hasattr(self, "le_to"):
-                    # store recipient in transmittals.client; fallback to project client_reference
-                    to_val = (self._current_header or {}).get("client", "") or ""
-                    if not to_val:
-                        try:
-                            from ..services.db import get_project
-                            proj = get_project(self.db_path) or {}
-                            to_val = proj.get("client_reference", "") or ""
-                        except Exception:
-                            pass
-                    self.le_to.setText(to_val)
-            except Exception:
-                pass
-        except Exception:
-            pass
+            dt = datetime.fromisoformat(co)  # ISO date or datetime from the DB
+            co = dt.strftime("%d/%m/%Y %H:%M" if ":" in co else "%d/%m/%Y")
+        except ValueError:
+            pass  # already display format (or free text): show as stored
+        # store recipient in transmittals.client; fallback to project client_reference
+        to_val = hdr.get("client", "") or self._project.get("client_reference", "") or ""
+        self._prefill_header(co, hdr.get("title", "") or "", hdr.get("created_by", "") or "", to_val)
+
+        # RIGHT (snapshot) + LEFT (register minus snapshot) are read off the GUI thread
+        self._start_load(load_items=True)
+
+    def _prefill_header(self, date_txt: str, title: str, by: str, to: str):
+        """Set each header field once, without emitting textChanged."""
+        with QSignalBlocker(self.le_date), QSignalBlocker(self.le_title), \
+                QSignalBlocker(self.le_by), QSignalBlocker(self.le_to):
+            self.le_date.setText(date_txt)
+            self.le_title.setText(title)
+            self.le_by.setText(by)
+            self.le_to.setText(to)
+
+    def _start_load(self, load_items: bool, load_left: Optional[bool] = None):
+        """Start a background read; _on_load_done fills the panes.
+        The left pane is read only if it is on screen (or load_left=True); otherwise it is marked dirty."""
+        if load_left is None:
+            load_left = self._left_pane_open()
+        if not load_left:
+            self._items_left_dirty = True
+        self._load_generation += 1
+        task = _LoadTask(
+            self._load_generation, self.db_path,
+            (self._current_header or {}).get("id", None),
+            self.project_id, load_items, load_left,
+            self._register_cache, frozenset(self._right_ids),
+        )
+        task.signals.finished.connect(self._on_load_done)
+        self._load_task = task  # keep the wrapper (and its signals) alive until it reports
+        self._set_loading(True)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_load_done(self, generation: int, items: Optional[List[dict]], left: Optional[List[dict]],
+                      register: Optional[List[dict]]):
+        if generation != self._load_generation:
+            return  # selection changed since this load started
+        if register is not None:
+            self._register_cache = register
+        self._load_task = None
+        self._set_loading(False)
+        if items is not None:
+            self._items_right = items
+            self._right_ids = {it["_cid"] for it in items}
+        # LEFT: cached register minus the transmittal, filtered in the task
+        # (None = not read; the pane stays empty until _ensure_left_loaded)
+        self._items_left = left or []
+        if left is not None:
+            self._items_left_dirty = False
+        self._render_tables()
 
-        # RIGHT: snapshot from DB
-        try:
-            tid = (self._current_header or {}).get("id", None)
-            self._items_right = get_transmittal_items(self.db_path, tid) if tid is not None else []
-        except Exception:
-            self._items_right = []
+    def _left_pane_open(self) -> bool:
+        """True when the left pane is on screen and not collapsed in the splitter."""
+        return self.tbl_left.isVisible() and self._split.sizes()[0] > 0
 
-        # LEFT: list_documents_with_latest(db, pid, state='active') MINUS right
-        self._items_left = self._load_register_minus_right()
-        self._render_tables()
+    def _ensure_left_loaded(self, force: bool = False):
+        """Read the left pane if it was skipped (or on demand, with force=True)."""
+        if not (self.db_path and self._current_header) or self._load_timer.isActive():
+            return  # nothing selected, or a pending load will decide for itself
+        if not force and not (self._items_left_dirty and self._left_pane_open()):
+            return
+        # A load still in flight is superseded by this one, so re-read its items too
+        self._start_load(load_items=self._load_task is not None, load_left=True)
 
-    def _load_register_minus_right(self) -> List[dict]:
-        if not (self.db_path and self.project_id and list_documents_with_latest):
-            return []
-        try:
-            rows = list_documents_with_latest(self.db_path, self.project_id, state="active") or []
-            right_ids = {(it.get("doc_id") or "").strip() for it in self._items_right}
-            out = []
-            for r in rows:
-                did = (r.get("doc_id") or "").strip()
-                if did and did not in right_ids:
-                    out.append(r)
-            return out
-        except Exception:
-            print("[HistoryTab] load register error:\n" + traceback.format_exc(), flush=True)
-            return []
+    def _set_loading(self, busy: bool):
+        """Pane actions need both lists, so hold them off while a load runs."""
+        for b in (self.btn_add, self.btn_load_left, self.btn_remove, self.btn_remap):
+            b.setEnabled(not busy)
+        number = (self._current_header or {}).get("number", "")
+        if number:
+            self.lbl_sel.setText(f"Transmittal: {number}" + (" (loading…)" if busy else ""))
 
     # -------- Render --------
     def _render_tables(self):
-        # LEFT
-        self.tbl_left.setRowCount(len(self._items_left))
-        for r, it in enumerate(self._items_left):
-            self.tbl_left.setItem(r, 0, QTableWidgetItem(it.get("doc_id", "")))
-            self.tbl_left.setItem(r, 1, QTableWidgetItem(it.get("latest_rev") or it.get("revision", "")))
-            self.tbl_left.setItem(r, 2, QTableWidgetItem(it.get("doc_type", "")))
-            self.tbl_left.setItem(r, 3, QTableWidgetItem(it.get("status", "")))
-            self.tbl_left.setItem(r, 4, QTableWidgetItem(it.get("description", "")))
-            self.tbl_left.setItem(r, 5, QTableWidgetItem(it.get("file_type", "")))
-        self.tbl_left.resizeColumnsToContents()
-
-        # RIGHT
-        self.tbl_right.setRowCount(len(self._items_right))
-        for r, it in enumerate(self._items_right):
-            self.tbl_right.setItem(r, 0, QTableWidgetItem(it.get("doc_id", "")))
-            self.tbl_right.setItem(r, 1, QTableWidgetItem(it.get("revision", "")))
-            self.tbl_right.setItem(r, 2, QTableWidgetItem(it.get("doc_type", "")))
-            self.tbl_right.setItem(r, 3, QTableWidgetItem(it.get("status", "")))
-            self.tbl_right.setItem(r, 4, QTableWidgetItem(it.get("description", "")))
-            self.tbl_right.setItem(r, 5, QTableWidgetItem(it.get("file_type", "")))
-            self.tbl_right.setItem(r, 6, QTableWidgetItem(it.get("file_path", "")))
-        self.tbl_right.resizeColumnsToContents()
+        # Models read cells from the row dicts on demand; no per-cell items.
+        # Repaint each table once, after its model has been swapped; skip a table
+        # whose displayed values are unchanged (e.g. Reload with no DB changes).
+        new_left_fp = self.left_model.fingerprint(self._items_left)
+        new_right_fp = self.right_model.fingerprint(self._items_right)
+        for tbl, model, rows, changed in (
+                (self.tbl_left, self.left_model, self._items_left, new_left_fp != self._left_fp),
+                (self.tbl_right, self.right_model, self._items_right, new_right_fp != self._right_fp)):
+            if not changed:
+                continue
+            tbl.setUpdatesEnabled(False)
+            try:
+                model.set_rows(rows)
+            finally:
+                tbl.setUpdatesEnabled(True)
+        self._left_fp, self._right_fp = new_left_fp, new_right_fp
 
     # -------- Selection helpers --------
-    def _selected_doc_ids(self, table: QTableWidget) -> List[str]:
-        out: List[str] = []
-        for idx in table.selectionModel().selectedRows():
-            item = table.item(idx.row(), 0)
-            if item:
-                did = (item.text() or "").strip()
-                if did:
-                    out.append(did)
-        # dedupe, preserve order
-        seen, uniq = set(), []
-        for d in out:
-            if d not in seen:
-                seen.add(d); uniq.append(d)
-        return uniq
+    def _selected_doc_ids(self, table: QTableView) -> List[str]:
+        # UserRole is the row dict; its "_cid" is already the canonical doc_id (one per row)
+        cids = [idx.data(Qt.UserRole)["_cid"] for idx in table.selectionModel().selectedRows(0)]
+        return [c for c in cids if c]
 
     # -------- Add / Remove --------
     def _add_selected(self):
@@ -321,9 +431,24 @@ class HistoryTab(QWidget):
         try:
             items = [{"doc_id": d} for d in dids]
             edit_transmittal_add_items(self.db_path, number, items)
-            self._on_transmittal_changed(self.cb_trans.currentIndex())
         except Exception as e:
             QMessageBox.warning(self, "Add failed", str(e))
+            self._on_transmittal_changed(self.cb_trans.currentIndex())
+            return
+        # Move the rows across locally; the DB fills new items from the same register snapshot
+        added = set(dids) - self._right_ids
+        moved = [r for r in self._items_left if r["_cid"] in added]
+        for r in moved:
+            self._items_right.append({
+                "doc_id": r.get("doc_id") or "", "doc_type": r.get("doc_type") or "",
+                "revision": r.get("latest_rev") or "", "file_path": "",
+                "file_type": r.get("file_type") or "", "description": r.get("description") or "",
+                "status": r.get("status") or "", "_cid": r["_cid"],
+            })
+        self._items_right.sort(key=lambda it: it["_cid"].casefold())
+        self._right_ids |= added
+        self._items_left = [r for r in self._items_left if r["_cid"] not in added]
+        self._render_tables()
 
     def _remove_selected(self):
         if not (self.db_path and self._current_header):
@@ -334,9 +459,16 @@ class HistoryTab(QWidget):
         number = self._current_header.get("number", "")
         try:
             edit_transmittal_remove_items(self.db_path, number, dids)
-            self._on_transmittal_changed(self.cb_trans.currentIndex())
         except Exception as e:
             QMessageBox.warning(self, "Remove failed", str(e))
+            self._on_transmittal_changed(self.cb_trans.currentIndex())
+            return
+        removed = set(dids)
+        self._items_right = [it for it in self._items_right if it["_cid"] not in removed]
+        self._right_ids -= removed
+        self._render_tables()
+        # Removed rows return to the left in register order: re-read that pane only
+        self._start_load(load_items=False)
 
     # -------- Save & Rebuild (clears Files/ and regenerates PDF) -------------
     def _save_and_rebuild(self):
@@ -362,13 +494,14 @@ class HistoryTab(QWidget):
             return
 
         # Build payload for FilesTab edit mode
-        items = [dict(it) for it in self._items_right]  # carry file_path + metadata
-        file_mapping: Dict[str, str] = {}
-        for it in items:
-            did = (it.get("doc_id") or "").strip()
-            fp = (it.get("file_path") or "").strip()
-            if did and fp:
-                file_mapping[did] = fp
+        # FilesTab only reads the item dicts (its snapshot copies them), so share them;
+        # the list itself is copied because add/remove here edit it in place
+        items = list(self._items_right)  # carry file_path + metadata
+        file_mapping: Dict[str, str] = {
+            did: fp
+            for did, fp in ((it["_cid"], (it.get("file_path") or "").strip()) for it in items)
+            if did and fp
+        }
 
         payload = {
             "mode": "edit",
@@ -392,10 +525,10 @@ class HistoryTab(QWidget):
             return
         try:
             # Save date only (extend to title/client later if you want)
-            co_text = (self.le_date.text().strip() if hasattr(self, "le_date") else "")
-            title_txt = (self.le_title.text().strip() if hasattr(self, "le_title") else "")
-            by_text = (self.le_by.text().strip() if hasattr(self, "le_by") else "")
-            to_text = (self.le_to.text().strip() if hasattr(self, "le_to") else "")
+            co_text = self.le_date.text().strip()
+            title_txt = self.le_title.text().strip()
+            by_text = self.le_by.text().strip()
+            to_text = self.le_to.text().strip()
 
             edit_transmittal_update_header(
                 self.db_path, number,
@@ -404,7 +537,18 @@ class HistoryTab(QWidget):
                 created_by=by_text or None,
                 client=to_text or None  # store “To” in transmittals.client
             )
-            self.refresh()
+            # Mirror the saved fields (blank = left unchanged) into the cached header and
+            # relabel just this combo row; no need to re-read every transmittal
+            hdr = self._current_header
+            for key, val in (("created_on", co_text), ("title", title_txt),
+                             ("created_by", by_text), ("client", to_text)):
+                if val:
+                    hdr[key] = val
+            idx = self.cb_trans.currentIndex()
+            if idx >= 0:
+                with QSignalBlocker(self.cb_trans):
+                    self.cb_trans.setItemText(idx, f"{hdr.get('number','')} — {hdr.get('title','')}")
+                    self.cb_trans.setItemData(idx, hdr)
             QMessageBox.information(self, "Saved", "Header updated.")
         except Exception as e:
             QMessageBox.warning(self, "Update failed", str(e))
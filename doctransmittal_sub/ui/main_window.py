@@ -1,62 +1,187 @@
 from __future__ import annotations
 
+import os
+import re
+import sys
+import traceback
 import warnings
+import webbrowser
+from datetime import datetime, date
+from functools import lru_cache
+from itertools import chain, islice
 from pathlib import Path
-from typing import List
+from typing import List, Dict, Tuple, Optional
+from weakref import WeakSet
+
+from PyQt5.QtCore import Qt, QSize, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QIcon, QPixmap, QFont, QStaticText, QColor, QPainter, QPalette
+from PyQt5.QtWidgets import (
+    QMainWindow, QTabWidget, QAction, QMessageBox, QInputDialog, QDockWidget, QSizePolicy,
+    QApplication, QFileDialog, QDialog, QStackedWidget, QWidget, QVBoxLayout, QHBoxLayout,
+    QLabel, QLineEdit, QPushButton, QProgressDialog,
+)
 
-import pandas as pd
-from PyQt5.QtWidgets import QMainWindow, QTabWidget, QAction, QMessageBox, QInputDialog, QDockWidget, QSizePolicy, \
-    QApplication, QActionGroup, QFileDialog, QDialog
-from PyQt5.QtCore import Qt
 from doctransmittal_sub.core.settings import SettingsManager
 from doctransmittal_sub.core.excepthook import install_excepthook
+from doctransmittal_sub.core.logger import get_logger
 from .register_tab import RegisterTab
 from .transmittal_tab import TransmittalTab
 from .files_tab import FilesTab
 from .history_tab import HistoryTab
+from .checkprint_tab import CheckPrintTab
+from .rfi_tab import RfiTab
 from ..models.document import DocumentRow
 from .widgets.sidebar import SidebarWidget
+from .widgets.lazy_tab import LazyTabPage
+from .widgets.appearance_dialog import AppearanceDialog
+from .widgets.toast import toast
+from .theme_qss import build_qss, palette
 from .project_settings_dialog import ProjectSettingsDialog
 from .templates_dialog import TemplatesDialog
-from ..services.db import list_transmittals
-from PyQt5.QtGui import QIcon, QPixmap, QFont
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QHBoxLayout
-import sys
-from PyQt5.QtWidgets import QLabel, QWidget, QVBoxLayout, QStackedLayout, QSizePolicy
-from PyQt5.QtGui import QPixmap, QIcon
-from PyQt5.QtGui import QFont
-from PyQt5.QtWidgets import QApplication, QAction
-
-from ..services.db import get_project, list_documents_with_latest
-from ..services.receipt_pdf import export_progress_report_pdf
-from datetime import datetime, date
-from .rfi_tab import RfiTab
-from .widgets.rfi_sidebar import RfiSidebarWidget
-from PyQt5.QtWidgets import QLineEdit, QPushButton, QLabel, QHBoxLayout  # if not already imported
-from .checkprint_tab import CheckPrintTab
+from .row_attributes_editor import DEFAULT_ROW_OPTIONS
+from ..services.db import (
+    get_project, list_documents_with_latest, insert_new_documents_bulk, delete_preset,
+    init_db, upsert_project, set_row_options,
+)
+from ..services.receipt_pdf import export_progress_report_pdf, export_register_report_pdf
 
 
 # --- UI assets helper (works in dev + PyInstaller) --------------------------
-from pathlib import Path
+# Resolved once at import; lookups below are plain string joins (no resolve/stat)
+if getattr(sys, "_MEIPASS", None):
+    # PyInstaller bundle path
+    _RES_BASE = os.path.join(sys._MEIPASS, "doctransmittal_sub", "resources")
+else:
+    _RES_BASE = str(Path(__file__).resolve().parent.parent / "resources")
+
 
+@lru_cache(maxsize=64)
 def _res(*parts):
     """
     Returns an absolute path to a file inside doctransmittal_sub/resources/.
     Works both in dev and when packaged with PyInstaller.
     """
-    import sys
-    if getattr(sys, "_MEIPASS", None):
-        # PyInstaller bundle path
-        base = Path(sys._MEIPASS) / "doctransmittal_sub" / "resources"
-    else:
-        base = Path(__file__).resolve().parent.parent / "resources"
-    return str((base.joinpath(*parts)).resolve())
+    return os.path.join(_RES_BASE, *parts)
+
+
+# Compiled Qt resources (see resources/resources.qrc). Until resources_rc.py has been
+# built with pyrcc5, assets are read from disk through _res() as before.
+try:
+    from .. import resources_rc  # noqa: F401  (registers the ":/..." paths)
+    _HAVE_QRC = True
+except ImportError:
+    _HAVE_QRC = False
+
+
+def _asset(name: str) -> str:
+    """Qt path for a UI asset: ":/name" from the compiled resources, else the file on disk."""
+    return f":/{name}" if _HAVE_QRC else _res(name)
+
+
+# Used for both the window icon and the brand-bar logo
+_LOGO_PATH = _asset("logo.png")
+
+
+# Excel migration: header-row aliases and a single pattern matching any of them
+_HEADER_KEYS = ("rev", "document no.", "document no", "doc id", "document id",
+                "document type", "doc type", "type", "file type", "description", "status")
+_HEADER_KEY_RE = re.compile("|".join(map(re.escape, _HEADER_KEYS)))
+# Cached formula errors come back from openpyxl (data_only) as plain strings
+_EXCEL_ERRORS = frozenset(("#N/A", "#REF!", "#VALUE!", "#DIV/0!", "#NAME?", "#NULL!",
+                           "#NUM!", "#GETTING_DATA", "#SPILL!", "#CALC!"))
+
+
+def _cell_text(v) -> str:
+    """Stripped text of a register cell; None, blanks and Excel error values read as empty."""
+    if v is None:
+        return ""
+    s = str(v).strip()
+    return "" if s.upper() in _EXCEL_ERRORS else s
+# Migration diagnostics go to the app log at DEBUG; the row preview only runs with DOCTRANS_DEBUG set
+_log = get_logger()
+_DEBUG = bool(os.environ.get("DOCTRANS_DEBUG"))
+
+
+class _MigrateSignals(QObject):
+    progress = pyqtSignal(str)   # stage message
+    done = pyqtSignal(object)    # (inserted, skipped), or None if no rows were found
+    failed = pyqtSignal(str)     # traceback text
+
 
+class _MigrateTask(QRunnable):
+    """
+    Runs MainWindow._run_excel_migration on the global thread pool. The db helpers open
+    their own SQLite connections, so this is safe off the GUI thread.
+    """
+    def __init__(self, path: str, db_path, project_id: int):
+        super().__init__()
+        self.signals = _MigrateSignals()
+        self._path = path
+        self._db_path = db_path
+        self._project_id = project_id
+
+    def run(self):
+        try:
+            res = MainWindow._run_excel_migration(
+                self._path, self._db_path, self._project_id, self.signals.progress.emit)
+        except Exception:
+            self.signals.failed.emit(traceback.format_exc())
+            return
+        self.signals.done.emit(res)
 
+class _BrandLabel(QWidget):
+    """
+    Brand-bar text drawn from a QStaticText, which keeps its layout between paints.
+    Font and colour are set directly (set_style) so re-theming never re-parses a stylesheet.
+    """
+    def __init__(self, text: str = "", parent=None):
+        super().__init__(parent)
+        self._static = QStaticText(text)
+        self._static.setTextFormat(Qt.PlainText)
+        self._color = QColor("#E7ECF4")
+        self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+
+    def text(self) -> str:
+        return self._static.text()
+
+    def setText(self, text: str):
+        text = text or ""
+        if text != self._static.text():
+            self._static.setText(text)
+            self.updateGeometry()
+            self.update()
+
+    def set_style(self, font: QFont, color: str):
+        self.setFont(font)
+        self._color = QColor(color)
+        self.updateGeometry()
+        self.update()
+
+    def sizeHint(self) -> QSize:
+        fm = self.fontMetrics()
+        return QSize(fm.horizontalAdvance(self.text()), fm.height())
+
+    def minimumSizeHint(self) -> QSize:
+        return self.sizeHint()
+
+    def paintEvent(self, _e):
+        p = QPainter(self)
+        p.setFont(self.font())
+        p.setPen(self._color)
+        p.drawStaticText(0, (self.height() - self.fontMetrics().height()) // 2, self._static)
+        p.end()
 
 
 class MainWindow(QMainWindow):
 
+    # Generated (main, sidebar, checkprint) stylesheets keyed by (theme, point size)
+    _qss_cache: Dict[Tuple[str, int], Tuple[str, str, str]] = {}
+    _last_qss_key: Optional[Tuple[str, int]] = None
+    # Application palette per theme
+    _palette_cache: Dict[str, QPalette] = {}
+    # Brand-bar logo, scaled once per height
+    _logo_cache: Dict[int, QPixmap] = {}
+
     # ---- THEME --------------------------------------------------------------
     def _apply_theme(self):
         theme = (self.settings.get("ui.theme", "dark") or "dark").lower()
@@ -64,398 +189,80 @@ class MainWindow(QMainWindow):
 
         # --- stable base: never compound the delta ---
         target_pt = max(8, int(self._base_font_pt) + font_delta)
+        key = (theme, target_pt)
+        if self._last_qss_key == key:
+            return  # same theme and size as what is applied: nothing to re-skin
+        # Font + stylesheet changes each invalidate every view; batch them into one repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self._restyle(theme, target_pt)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+
+    def _restyle(self, theme: str, target_pt: int):
+        """Apply the font, brand-bar and stylesheets for (theme, target_pt)."""
+        key = (theme, target_pt)
         app = QApplication.instance()
         if app:
             f = QFont(self._base_font_family, target_pt)
-            app.setFont(f)
-
-        # --- theme palettes ---
-        if theme == "light":
-            accent = "#2D5BFF"
-            panel = "#f7f8fb"
-            border = "#d7deea"
-            text = "#0b1325"
-            subtext = "#5c6b82"
-            pane_bg = "#ffffff"
-            head_bg = "#eef2f8"
-            list_bg = "#ffffff"
-            sel_bg = "rgba(45,91,255,0.14)"
-            tree_alt = "#f2f6fc"
-            root_bg = "#ffffff"
-            tab_txt = "#0b1325"
-            tab_bg = "#e9eef7"
-            tab_bg_hover = "#dfe7f4"
-            tab_bg_sel = "#dfe7f4"
-            btn_bg = "#f0f3f9"
-            btn_bg_hover = "#e7ecf7"
-            btn_bg_press = "#dfe7f4"
-        else:
-            accent = "#4F7DFF"
-            panel = "#0f1724"
-            border = "#233044"
-            text = "#E7ECF4"
-            subtext = "#9fb3c8"
-            pane_bg = "#0d1526"
-            head_bg = "#121b2d"
-            list_bg = "#0f1724"
-            sel_bg = "rgba(79,125,255,0.35)"
-            tree_alt = "#101a30"
-            root_bg = "#0b1220"
-            tab_txt = "rgba(255,255,255,0.92)"
-            tab_bg = "#1b253a"
-            tab_bg_hover = "#223154"
-            tab_bg_sel = "#223154"
-            btn_bg = "#19233a"
-            btn_bg_hover = "#20304c"
-            btn_bg_press = "#2b3e64"
+            if app.font() != f:  # setFont re-polishes every widget, even for an equal font
+                app.setFont(f)
+            # Plain text colours come from the palette, not the stylesheet
+            app.setPalette(self._theme_palette(theme))
+
+        pal = palette(theme)
 
         # sizes
-        tab_pt = target_pt + 3
         brand_title_pt = target_pt + 2
 
         try:
-            self._brand_title.setStyleSheet(f"font-size:{brand_title_pt}pt; font-weight:700; color:{text};")
-            self._brand_project.setStyleSheet(f"color:{subtext}; font-size:{target_pt}pt;")
-            self._brand_user.setStyleSheet(f"color:#AFC7FF; font-weight:600; font-size:{target_pt}pt;")
+            family = self._base_font_family
+            self._brand_title.set_style(QFont(family, brand_title_pt, QFont.Bold), pal["text"])
+            self._brand_project.set_style(QFont(family, target_pt), pal["subtext"])
+            self._brand_user.set_style(QFont(family, target_pt, QFont.DemiBold), "#AFC7FF")
         except Exception:
             pass
 
-        # --- stylesheet ---
-        self.setStyleSheet(f"""
-        QWidget#CentralWrap {{
-            background: {root_bg};
-        }}
-        QWidget#CentralWrap QLabel,
-        QWidget#CentralWrap QCheckBox {{
-            color: {text};
-        }}
-
-        QTabWidget::pane {{
-            background: {panel};
-            border: 1px solid {border};
-            border-radius: 12px;
-            padding-top: 6px;
-        }}
-
-        QTabWidget::tab-bar {{
-            alignment: left;
-        }}
-
-        /* === SUB-HEADERS (Register / Transmittal / Files / History) === */
-        QTabBar#SubTabBar::tab {{
-            min-width: 140px;
-            min-height: 34px;            /* compact; still no clipping */
-            padding: 7px 18px;
-            margin: 3px 4px;
-            border-radius: 10px;
-            font-size: {tab_pt}pt;
-            font-weight: 700;
-            line-height: 1.35em;
-            color: {tab_txt};
-            background: {tab_bg};
-            border: 1px solid transparent;
-        }}
-        QTabBar#SubTabBar::tab:hover {{
-            background: {tab_bg_hover};
-        }}
-        QTabBar#SubTabBar::tab:selected {{
-            background: {tab_bg_sel};
-            color: {'#000' if theme == 'light' else '#fff'};
-            border: 1px solid {accent};
-        }}
-
-        /* === MAIN HEADERS (Document Register / RFI) === */
-        QTabWidget#MainTabs::pane {{
-            border: none;
-            background: {root_bg};
-            margin-top: 4px;
-        }}
-        QTabBar#MainTabBar::tab {{
-            min-width: 300px;
-            min-height: 60px;            /* clearly taller */
-            padding: 16px 36px;
-            margin: 8px 10px;
-            border-radius: 16px;
-            font-size: {tab_pt + 5}pt;   /* larger than sub */
-            font-weight: 900;
-            line-height: 1.55em;
-            color: {tab_txt};
-            background: {tab_bg};
-            border: 1px solid {border};
-        }}
-        QTabBar#MainTabBar::tab:hover {{
-            background: {tab_bg_hover};
-        }}
-        QTabBar#MainTabBar::tab:selected {{
-            background: {tab_bg_sel};
-            color: {'#000' if theme == 'light' else '#fff'};
-            border: 1px solid {accent};
-        }}
-        QTabWidget#MainTabs::tab-bar {{
-            border-bottom: 2px solid {border};
-            padding-bottom: 2px;
-        }}
-
-        QAbstractScrollArea {{
-            background: transparent;
-        }}
-        QAbstractScrollArea::viewport {{
-            background: transparent;
-        }}
-
-        QTableView {{
-            background: transparent;
-            gridline-color:{border};
-            selection-background-color: {sel_bg};
-            alternate-background-color: {tree_alt};   /* ✅ fixes bright white alt rows */
-            border:1px solid {border};
-            border-radius:10px;
-            color:{text};
-        }}
-        QHeaderView::section {{
-            background: {head_bg};
-            color: {subtext};
-            padding: 7px 8px;
-            border: 0;
-            border-right: 1px solid {border};
-            font-weight: 600;
-        }}
-
-        QWidget#CentralWrap QGroupBox {{
-            color: {text};
-            border: 1px solid {border};
-            border-radius: 12px;
-            margin-top: 14px;
-            padding-top: 8px;
-            background: {pane_bg};
-        }}
-        QWidget#CentralWrap QGroupBox::title {{
-            subcontrol-origin: margin;
-            left: 12px;
-            padding: 0 6px;
-            font-weight: 700;
-            color: {text};
-        }}
-
-        QWidget#CentralWrap QTreeView,
-        QWidget#CentralWrap QTreeWidget {{
-            background: transparent;
-            color: {text};
-            alternate-background-color: {tree_alt};
-            border: 1px solid {border};
-            border-radius: 10px;
-        }}
-        QWidget#CentralWrap QTreeView::item:selected,
-        QWidget#CentralWrap QTreeWidget::item:selected {{
-            background: {sel_bg};
-            color: {'#000' if theme == 'light' else '#fff'};
-        }}
-
-        QLineEdit, QComboBox, QSpinBox, QTextEdit {{
-            background: {list_bg};
-            color: {text};
-            border: 1px solid {border};
-            border-radius: 10px;
-            padding: 7px 9px;
-            selection-background-color: {sel_bg};
-        }}
-        QLineEdit::placeholder,
-        QTextEdit[acceptRichText="false"]::placeholder {{
-            color: {subtext};
-        }}
-
-        QPushButton {{
-            background: {btn_bg};
-            color: {text};
-            border: 1px solid {border};
-            border-radius: 12px;
-            padding: 8px 12px;
-            font-weight: 600;
-        }}
-        QPushButton:hover  {{ background: {btn_bg_hover}; }}
-        QPushButton:pressed{{ background: {btn_bg_press}; }}
-        QPushButton#Primary {{
-            background: {accent};
-            color: white;
-            border: none;
-        }}
-
-        QToolTip {{
-            background: {panel};
-            color: {text};
-            border: 1px solid {border};
-            padding: 6px;
-            border-radius: 6px;
-        }}
-
-        QDialog {{
-            background: {panel};
-            border: 1px solid {border};
-            border-radius: 12px;
-        }}
-        QDialog QLabel          {{ color: {text}; }}
-        QDialog QLabel:disabled {{ color: {subtext}; }}
-        QDialog QGroupBox {{
-            color: {text};
-            border: 1px solid {border};
-            border-radius: 10px;
-            margin-top: 12px;
-            padding-top: 6px;
-            background: {pane_bg};
-        }}
-        QDialog QLineEdit,
-        QDialog QComboBox,
-        QDialog QTextEdit,
-        QDialog QSpinBox {{
-            background: {list_bg};
-            color: {text};
-            border: 1px solid {border};
-            border-radius: 10px;
-            padding: 7px 9px;
-        }}
-        QDialog QLineEdit::placeholder {{ color: {subtext}; }}
-
-        QComboBox QAbstractItemView {{
-            background: {list_bg};
-            color: {text};
-            border: 1px solid {border};
-            selection-background-color: {tab_bg_hover};
-            outline: 0;
-        }}
-
-        QMessageBox {{
-            background: {panel};
-            border: 1px solid {border};
-            border-radius: 12px;
-        }}
-        QMessageBox QLabel      {{ color: {text}; }}
-        QMessageBox QPushButton {{ min-width: 84px; }}
-
-        QDockWidget#LeftDock::title {{
-            text-align: left;
-            padding: 8px 10px;
-            background: {root_bg};
-            color: {subtext};
-            border-bottom: 1px solid {border};
-        }}
-
-        #Sidebar {{
-            background: {panel};
-            border-right: 1px solid {border};
-            padding: 10px;
-        }}
-        #Sidebar QWidget {{ background: transparent; }}
-        #Sidebar QLabel, #Sidebar QCheckBox, #Sidebar QToolButton {{ color: {text}; }}
-        #Sidebar QLineEdit, #Sidebar QComboBox, #Sidebar QSpinBox, #Sidebar QTextEdit {{
-            background: {list_bg};
-            color: {text};
-            border: 1px solid {border};
-            border-radius: 10px;
-            padding: 7px 9px;
-        }}
-        #Sidebar QLineEdit::placeholder {{ color: {subtext}; }}
-        #Sidebar QComboBox QAbstractItemView {{
-            background: {list_bg};
-            color: {text};
-            border: 1px solid {border};
-            selection-background-color: {sel_bg};
-            outline: 0;
-        }}
-        #Sidebar QListWidget {{
-            background: {list_bg};
-            color: {text};
-            border: 1px solid {border};
-            border-radius: 10px;
-        }}
-        #Sidebar QGroupBox {{
-            color: {text};
-            border: 1px solid {border};
-            border-radius: 12px;
-            margin-top: 12px;
-            padding-top: 8px;
-            background: {pane_bg};
-        }}
-        #Sidebar QGroupBox::title {{
-            subcontrol-origin: margin;
-            left: 12px;
-            padding: 0 6px;
-            font-weight: 700;
-            color: {text};
-        }}
-        #Sidebar QPushButton {{
-            background: {btn_bg};
-            color: {text};
-            border: 1px solid {border};
-            border-radius: 12px;
-            padding: 8px 12px;
-            font-weight: 600;
-        }}
-        #Sidebar QPushButton:hover  {{ background: {btn_bg_hover}; }}
-        #Sidebar QPushButton:pressed{{ background: {btn_bg_press}; }}
-
-        /* Light 'More ▾' menu for readability */
-        QMenu#BulkMoreMenu {{
-            background: #ffffff;
-            color: #111111;
-            border: 1px solid {border};
-            border-radius: 8px;
-            padding: 6px 4px;
-        }}
-        QMenu#BulkMoreMenu::separator {{
-            height: 1px;
-            background: #e0e6f0;
-            margin: 6px 10px;
-        }}
-        QMenu#BulkMoreMenu::item {{
-            background: transparent;
-            color: #111111;
-            padding: 8px 12px;
-            border-radius: 6px;
-        }}
-        QMenu#BulkMoreMenu::item:selected {{
-            background: #e7f0ff;
-            color: #000000;
-        }}
-        QMenu#BulkMoreMenu::item:disabled {{
-            color: #9aa3b2;
-            background: transparent;
-        }}
-                /* ===== CHECKPRINT TAB TEXT COLOURS ===== */
-        QWidget#CheckPrintTab QLabel {{
-            color: {text};
-            background: transparent;
-        }}
-
-        QWidget#CheckPrintTab QGroupBox {{
-            color: {text};
-            background: transparent;
-        }}
-
-        QWidget#CheckPrintTab QListWidget {{
-            color: {text};
-            background: transparent;
-        }}
-
-        QWidget#CheckPrintTab QTreeView {{
-            color: {text};
-            background: transparent;
-        }}
-
-        QWidget#CheckPrintTab QTreeWidget {{
-            color: {text};
-            background: transparent;
-        }}
-
-        QWidget#CheckPrintTab QCheckBox {{
-            color: {text};
-            background: transparent;
-        }}
-
-        QWidget#CheckPrintTab QPushButton {{
-            color: {text};
-        }}
-
-        """)
+        # --- stylesheets (built once per theme/size) ---
+        sheets = self._qss_cache.get(key)
+        if sheets is None:
+            sheets = self._qss_cache[key] = build_qss(theme, target_pt)
+        main_qss, sidebar_qss, checkprint_qss = sheets
+        targets = [(self, main_qss), (self.sidebar, sidebar_qss)]
+        if self.checkprint_tab is not None:
+            targets.append((self.checkprint_tab, checkprint_qss))
+        if self.rfi_tab is not None:
+            targets.append((self.rfi_tab.sidebar, sidebar_qss))
+        # Re-polishing is the expensive part: only touch widgets whose sheet actually changed
+        # (the sidebar/CheckPrint sheets carry no font sizes, so a font-only change skips them)
+        for w, qss in targets:
+            if qss != w.styleSheet():
+                w.setStyleSheet(qss)
+        self._last_qss_key = key
+
+    def _theme_palette(self, theme: str) -> QPalette:
+        """Application palette for `theme` (built once; re-setting the same one is a no-op in Qt)."""
+        qp = self._palette_cache.get(theme)
+        if qp is None:
+            pal = palette(theme)
+            qp = QPalette()
+            roles = [
+                (QPalette.Window, "root_bg"), (QPalette.WindowText, "text"),
+                (QPalette.Base, "list_bg"), (QPalette.AlternateBase, "tree_alt"),
+                (QPalette.Text, "text"), (QPalette.Button, "btn_bg"), (QPalette.ButtonText, "text"),
+                (QPalette.ToolTipBase, "panel"), (QPalette.ToolTipText, "text"),
+                (QPalette.Highlight, "accent"),
+            ]
+            if hasattr(QPalette, "PlaceholderText"):  # Qt 5.12+
+                roles.append((QPalette.PlaceholderText, "subtext"))
+            for role, key in roles:
+                qp.setColor(role, QColor(pal[key]))
+            qp.setColor(QPalette.HighlightedText, QColor("#ffffff"))
+            for role in (QPalette.WindowText, QPalette.Text, QPalette.ButtonText):
+                qp.setColor(QPalette.Disabled, role, QColor(pal["subtext"]))
+            self._palette_cache[theme] = qp
+        return qp
 
     def _build_brand_bar(self):
         bar = QWidget(self)
@@ -473,22 +280,26 @@ class MainWindow(QMainWindow):
 
         logo = QLabel(bar)
         try:
-            pm = QPixmap(_res("logo.png"))
-            logo.setPixmap(pm.scaledToHeight(36, Qt.SmoothTransformation))
+            pm = MainWindow._logo_cache.get(36)
+            if pm is None:  # smooth scaling is the slow part; do it once per height
+                pm = MainWindow._logo_cache[36] = QPixmap(_LOGO_PATH).scaledToHeight(36, Qt.SmoothTransformation)
+            logo.setPixmap(pm)
         except Exception:
             logo.setText(" ")  # fallback
         lay.addWidget(logo)
 
-        self._brand_title = QLabel("Document Manager", bar)
-        self._brand_title.setStyleSheet("font-size:16px; font-weight:700; color:#E7ECF4;")
+        title_font = QFont(self.font()); title_font.setPixelSize(16); title_font.setBold(True)
+        self._brand_title = _BrandLabel("Document Manager", bar)
+        self._brand_title.set_style(title_font, "#E7ECF4")
         lay.addWidget(self._brand_title)
 
-        self._brand_project = QLabel("—", bar)
-        self._brand_project.setStyleSheet("color:#9fb3c8;")
+        self._brand_project = _BrandLabel("—", bar)
+        self._brand_project.set_style(QFont(self.font()), "#9fb3c8")
         lay.addWidget(self._brand_project, 1)
 
-        self._brand_user = QLabel("—", bar)
-        self._brand_user.setStyleSheet("color:#AFC7FF; font-weight:600;")
+        user_font = QFont(self.font()); user_font.setWeight(QFont.DemiBold)
+        self._brand_user = _BrandLabel("—", bar)
+        self._brand_user.set_style(user_font, "#AFC7FF")
         lay.addWidget(self._brand_user)
 
         return bar
@@ -511,6 +322,107 @@ class MainWindow(QMainWindow):
         lay.addWidget(btn_new)
         return bar
 
+    # ---- lazily built tabs ------------------------------------------------------
+    def _on_sub_tab_changed(self, idx: int):
+        page = self.tabs.widget(idx)
+        if page is self._history_page and self.history_tab is not None:
+            # Register edits (status/rev/new/archived docs) don't reach History: re-read on return
+            self.history_tab.invalidate_register()
+        if isinstance(page, LazyTabPage):
+            page.materialize()
+
+    @property
+    def transmittal_tab(self) -> TransmittalTab:
+        """The Transmittal step, built the first time anything needs it."""
+        return self._transmittal_page.materialize()
+
+    @property
+    def files_tab(self) -> FilesTab:
+        """The Files step, built the first time anything needs it."""
+        return self._files_page.materialize()
+
+    def _make_transmittal_tab(self) -> TransmittalTab:
+        tab = TransmittalTab()
+        # Step navigation (Transmittal -> Files / back)
+        tab.backRequested.connect(self._go_back_to_register)
+        tab.proceedRequested.connect(self._go_to_files_step)
+        if self._tabs_db_path:
+            tab.set_db_path(self._tabs_db_path)
+        return tab
+
+    def _make_files_tab(self) -> FilesTab:
+        tab = FilesTab()
+        tab.backRequested.connect(self._go_back_to_transmittal)
+        tab.proceedCompleted.connect(self._reset_to_register)
+        # History ↔ Files (remap edit flow); History's own signal is wired in _make_history_tab
+        tab.remapCompleted.connect(self._return_to_history_after_remap)
+        tab.checkprintStarted.connect(self._on_checkprint_started)
+        try:
+            tab.btn_proceed.setObjectName("Primary")  # blue accent CTA
+        except Exception:
+            pass
+        return tab
+
+    def _make_history_tab(self) -> HistoryTab:
+        self.history_tab = HistoryTab()
+        self.history_tab.remapRequested.connect(self._start_remap_from_history)
+        if self._tabs_db_path:
+            self.history_tab.set_db_path(self._tabs_db_path)
+        return self.history_tab
+
+    def _make_checkprint_tab(self) -> CheckPrintTab:
+        self.checkprint_tab = CheckPrintTab()
+        sheets = self._qss_cache.get(self._last_qss_key)
+        if sheets:
+            self.checkprint_tab.setStyleSheet(sheets[2])
+        if self._tabs_db_path:
+            self.checkprint_tab.set_db_path(self._tabs_db_path)
+        return self.checkprint_tab
+
+    def _wire_signals(self):
+        """Connect the Register tab and sidebars, one (signal, slot) pair per row."""
+        reg, sb = self.register_tab, self.sidebar
+        wires = [
+            # Listen for project info from the Register tab
+            (reg.projectInfoReady, self._on_project_info_ready),
+            # Filters & selection
+            (sb.filtersChanged, reg.apply_filters),
+            (sb.showOnlySelectedToggled, reg.set_only_selected_filter),
+            (sb.selectAllRequested, reg.select_all_in_view),
+            (sb.clearSelectionRequested, reg.clear_selection_in_view),
+            (sb.clearAllRequested, reg.clear_selection_all),
+            (reg.selectionCountChanged, sb.set_selected_count),
+            # Presets
+            (reg.presetsReady, sb.set_preset_names),
+            (sb.savePresetRequested, reg.save_preset_as),
+            (sb.loadPresetRequested, reg.load_preset),
+            (sb.unloadPresetRequested, reg.unload_preset),
+            (sb.deletePresetRequested, self._delete_preset),
+            (reg.matchingPresetChanged, sb.set_loaded_preset_hint),
+            # Bulk edit / revisions
+            (sb.bulkApplyRequested, reg.apply_bulk_to_selected),
+            (sb.revisionIncrementRequested, reg._rev_increment_selected),
+            (sb.revisionDecrementRequested, reg._rev_decrement_selected),
+            (sb.revisionSetRequested, reg._rev_set_selected),
+            # SINGLE batch import hook
+            (sb.importBatchRequested, reg._import_batch_updates),
+            # Sidebar's row-option combos
+            (reg.rowOptionsReady, sb.set_apply_option_lists),
+            # Reports / migration
+            (sb.printProgressRequested, self._print_progress_report),
+            (sb.printRegisterRequested, self._on_print_register),
+            (sb.migrateExcelRequested, self._on_migrate_excel_clicked),
+        ]
+        # Sidebar(s) → Project Settings / Templates
+        sidebars = [sb] + ([self.rfi_tab.sidebar] if self.rfi_tab is not None else [])
+        for side in sidebars:
+            wires += [
+                (side.projectSettingsRequested, self._open_project_settings),
+                (side.templatesRequested, self._open_templates_viewer),
+            ]
+        for sig, slot in wires:
+            sig.connect(slot)
+
     def __init__(self, settings: SettingsManager, parent=None):
         super().__init__(parent)
         self.settings = settings
@@ -528,7 +440,14 @@ class MainWindow(QMainWindow):
         self.tabs = QTabWidget(doc_page)  # keep existing name so the rest of the code still works
         doc_v.addWidget(self.tabs, 1)
 
-        self.rfi_tab = RfiTab(self)
+        # RFI page is disabled (not added to mainTabs), so it is not built at all
+        self.rfi_tab: Optional[RfiTab] = None
+        # History / CheckPrint are built the first time their tab is opened (see _on_sub_tab_changed)
+        self.history_tab: Optional[HistoryTab] = None
+        self.checkprint_tab: Optional[CheckPrintTab] = None
+        self._tabs_db_path: Optional[Path] = None
+        # Open dialogs that restyle themselves on appearance changes (see track_themed_dialog)
+        self._themed_dialogs: "WeakSet[QDialog]" = WeakSet()
 
         wrap = QWidget(self);
         wrap.setObjectName("CentralWrap")
@@ -544,19 +463,20 @@ class MainWindow(QMainWindow):
         self.register_tab = RegisterTab(self.settings, on_proceed=self._on_register_proceed)
         self.tabs.addTab(self.register_tab, "Register")
 
-        self.transmittal_tab = TransmittalTab()
-        self.tabs.addTab(self.transmittal_tab, "Transmittal")
+        # Transmittal / Files stay disabled until Register → Proceed; built on first use
+        self._transmittal_page = LazyTabPage(self._make_transmittal_tab)
+        self.tabs.addTab(self._transmittal_page, "Transmittal")
 
-        self.files_tab = FilesTab()
-        self.tabs.addTab(self.files_tab, "Files")
+        self._files_page = LazyTabPage(self._make_files_tab)
+        self.tabs.addTab(self._files_page, "Files")
 
-        self.history_tab = HistoryTab()
-        self.tabs.addTab(self.history_tab, "History")
+        self._history_page = LazyTabPage(self._make_history_tab)
+        self.tabs.addTab(self._history_page, "History")
 
-        self.checkprint_tab = CheckPrintTab()
-        self.idx_checkprint = self.tabs.addTab(self.checkprint_tab, "CheckPrint")
+        self._checkprint_page = LazyTabPage(self._make_checkprint_tab)
+        self.idx_checkprint = self.tabs.addTab(self._checkprint_page, "CheckPrint")
         self.tabs.setTabEnabled(self.idx_checkprint, True)
-        self.files_tab.checkprintStarted.connect(self._on_checkprint_started)
+        self.tabs.currentChanged.connect(self._on_sub_tab_changed)
 
         # --- name the tab bars so we can style them differently ---
         self.mainTabs.setObjectName("MainTabs")
@@ -578,26 +498,21 @@ class MainWindow(QMainWindow):
 
         # Tab indexes and gating
         self.idx_register = self.tabs.indexOf(self.register_tab)
-        self.idx_transmit = self.tabs.indexOf(self.transmittal_tab)
-        self.idx_files = self.tabs.indexOf(self.files_tab)
-        self.idx_history = self.tabs.indexOf(self.history_tab)
+        self.idx_transmit = self.tabs.indexOf(self._transmittal_page)
+        self.idx_files = self.tabs.indexOf(self._files_page)
+        self.idx_history = self.tabs.indexOf(self._history_page)
         self.tabs.setTabEnabled(self.idx_transmit, False)
         self.tabs.setTabEnabled(self.idx_files, False)
-
-        # Step navigation (Transmittal -> Files / back)
-        self.transmittal_tab.backRequested.connect(self._go_back_to_register)
-        self.transmittal_tab.proceedRequested.connect(self._go_to_files_step)
-        self.files_tab.backRequested.connect(self._go_back_to_transmittal)
-        self.files_tab.proceedCompleted.connect(self._reset_to_register)
-        # History ↔ Files (remap edit flow)
-        self.history_tab.remapRequested.connect(self._start_remap_from_history)
-        self.files_tab.remapCompleted.connect(self._return_to_history_after_remap)
+        # Step navigation (Transmittal -> Files / back) is wired as each step tab is built
 
 
         # LEFT SIDEBAR
         self.sidebar = SidebarWidget()
         dock = QDockWidget("Filters & Actions", self)
-        dock.setWidget(self.sidebar)
+        # Both sidebars live in one stack; switching pages never reparents (or re-polishes) them
+        self._sidebar_stack = QStackedWidget(dock)
+        self._sidebar_stack.addWidget(self.sidebar)
+        dock.setWidget(self._sidebar_stack)
         dock.setFeatures(QDockWidget.NoDockWidgetFeatures)  # keep it fixed
         self.addDockWidget(Qt.LeftDockWidgetArea, dock)
         dock.setMinimumWidth(320)  # ~double the common default
@@ -610,18 +525,16 @@ class MainWindow(QMainWindow):
         self.sidebar.setAttribute(Qt.WA_StyledBackground, True)  # <— add this
 
         # Use the RfiTab’s actual sidebar (so its signals & project info work)
-        self.rfi_tab.sidebar.setObjectName("Sidebar")
-        self.rfi_tab.sidebar.setAttribute(Qt.WA_StyledBackground, True)
+        if self.rfi_tab is not None:
+            self.rfi_tab.sidebar.setObjectName("Sidebar")
+            self.rfi_tab.sidebar.setAttribute(Qt.WA_StyledBackground, True)
+            self._sidebar_stack.addWidget(self.rfi_tab.sidebar)
 
         def _swap_sidebar(idx: int):
-            try:
-                dock = self.findChild(QDockWidget, "LeftDock")
-                if idx == self.mainTabs.indexOf(self.rfi_tab):
-                    dock.setWidget(self.rfi_tab.sidebar)  # ← use the instance owned by RfiTab
-                else:
-                    dock.setWidget(self.sidebar)
-            except Exception:
-                pass
+            if self.rfi_tab is not None and idx == self.mainTabs.indexOf(self.rfi_tab):
+                self._sidebar_stack.setCurrentWidget(self.rfi_tab.sidebar)  # ← use the instance owned by RfiTab
+            else:
+                self._sidebar_stack.setCurrentWidget(self.sidebar)
 
         self.mainTabs.currentChanged.connect(_swap_sidebar)
         _swap_sidebar(self.mainTabs.currentIndex())  # ensure correct widget on startup
@@ -636,69 +549,37 @@ class MainWindow(QMainWindow):
         act_appearance.triggered.connect(self._open_appearance_dialog)
         m_view.addAction(act_appearance)
         # --- RFI Test ---
-        from .rfi_test_dialog import RfiTestDialog
+        # from .rfi_test_dialog import RfiTestDialog
         # m_rfi = self.menuBar().addMenu("RFI")
         # act_rfi_test = QAction("RFI Drop Test…", self)
         # act_rfi_test.triggered.connect(lambda: RfiTestDialog(self).exec_())
         # m_rfi.addAction(act_rfi_test)
 
-        # Listen for project info from the Register tab
-        self.register_tab.projectInfoReady.connect(self._on_project_info_ready)
-
-        # Filters & selection wires
-        self.sidebar.filtersChanged.connect(self.register_tab.apply_filters)
-        self.sidebar.showOnlySelectedToggled.connect(self.register_tab.set_only_selected_filter)
-        self.sidebar.selectAllRequested.connect(self.register_tab.select_all_in_view)
-        self.sidebar.clearSelectionRequested.connect(self.register_tab.clear_selection_in_view)
-        self.sidebar.clearAllRequested.connect(self.register_tab.clear_selection_all)
-        self.register_tab.selectionCountChanged.connect(self.sidebar.set_selected_count)
-
-        # Preset wires
-        self.register_tab.presetsReady.connect(self.sidebar.set_preset_names)
-        self.sidebar.savePresetRequested.connect(self.register_tab.save_preset_as)
-        self.sidebar.loadPresetRequested.connect(self.register_tab.load_preset)
-        self.sidebar.unloadPresetRequested.connect(self.register_tab.unload_preset)
-        self.sidebar.deletePresetRequested.connect(lambda name: self._delete_preset(name))
-        self.register_tab.matchingPresetChanged.connect(self.sidebar.set_loaded_preset_hint)
-
-        # Bulk edit / revisions
-        self.sidebar.bulkApplyRequested.connect(self.register_tab.apply_bulk_to_selected)
-        self.sidebar.revisionIncrementRequested.connect(self.register_tab._rev_increment_selected)
-        self.sidebar.revisionDecrementRequested.connect(self.register_tab._rev_decrement_selected)
-
-        self.sidebar.revisionSetRequested.connect(self.register_tab._rev_set_selected)
-
-        # SINGLE batch import hook
-        self.sidebar.importBatchRequested.connect(self.register_tab._import_batch_updates)
-
-        # Let the sidebar mirror the project’s row options for its combos
-        self.register_tab.rowOptionsReady.connect(self.sidebar.set_apply_option_lists)
-        self.register_tab._refresh_option_widgets()
-
-        # Progress report
-        self.sidebar.printProgressRequested.connect(self._print_progress_report)
-        # Register report
-        self.sidebar.printRegisterRequested.connect(self._on_print_register)
-        # Migrate Excel
-        self.sidebar.migrateExcelRequested.connect(self._on_migrate_excel_clicked)
-
-        install_excepthook()
-
-        # Sidebar → Project Settings
-        self.sidebar.projectSettingsRequested.connect(self._open_project_settings)
-        self.sidebar.templatesRequested.connect(self._open_templates_viewer)
-        self.rfi_tab.sidebar.projectSettingsRequested.connect(self._open_project_settings)
-        self.rfi_tab.sidebar.templatesRequested.connect(self._open_templates_viewer)
-        # Auto-refresh progress donut when the register table changes
+        self._wire_signals()
+        # Let the sidebar mirror the project’s row options for its combos (needs rowOptionsReady wired);
+        # filled once the window is up, with whatever options are current by then
+        QTimer.singleShot(0, self.register_tab._refresh_option_widgets)
+
+        # Crash-log hook (creates the logs folder) is installed once the window is up
+        QTimer.singleShot(0, install_excepthook)
+
+        # Auto-refresh progress donut when the register table changes.
+        # Bulk edits emit dataChanged per cell: coalesce them into one refresh per event-loop turn.
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(0)
+        self._progress_timer.timeout.connect(self.sidebar.refresh_progress)
         try:
-            self.register_tab.model.dataChanged.connect(lambda *a, **k: self.sidebar.refresh_progress())
-            self.register_tab.model.modelReset.connect(lambda *a, **k: self.sidebar.refresh_progress())
+            self.register_tab.model.dataChanged.connect(lambda *a, **k: self._progress_timer.start())
+            self.register_tab.model.modelReset.connect(lambda *a, **k: self._progress_timer.start())
         except Exception:
             pass
 
         # Window icon + theme
         try:
-            self.setWindowIcon(QIcon(_res("logo.png")))
+            # File-backed on purpose: QIcon decodes lazily per requested size, while the cached
+            # 36 px brand-bar pixmap would blur the larger taskbar / Alt-Tab icons
+            self.setWindowIcon(QIcon(_LOGO_PATH))
         except Exception:
             pass
 
@@ -707,10 +588,6 @@ class MainWindow(QMainWindow):
             self.register_tab.btn_proceed.setObjectName("Primary")
         except Exception:
             pass
-        try:
-            self.files_tab.btn_proceed.setObjectName("Primary")
-        except Exception:
-            pass
 
         try:
             self._brand_user.setText(self.settings.get("user.name","") or "—")
@@ -721,11 +598,10 @@ class MainWindow(QMainWindow):
         self._init_appearance_defaults()
         self._apply_theme()
 
-    from PyQt5.QtWidgets import QFileDialog
-    import warnings
-    import pandas as pd
-
     def _on_migrate_excel_clicked(self):
+        if getattr(self, "_migrate_task", None) is not None:
+            return  # an import is already running
+
         # 1) DB source of truth comes from Register tab
         db_path = getattr(self.register_tab, "db_path", None)
         project_id = getattr(self.register_tab, "project_id", None)
@@ -742,153 +618,159 @@ class MainWindow(QMainWindow):
         if not path:
             return
 
-        print(f"[migrate] Opening workbook: {path}")
-        with warnings.catch_warnings():
-            warnings.filterwarnings("ignore", category=UserWarning, module="openpyxl")
-            xf = pd.ExcelFile(path, engine="openpyxl")
-            sheet = "MI Documents" if "MI Documents" in xf.sheet_names else xf.sheet_names[0]
-            # Read without headers first so we can detect the header row robustly
-            df0 = pd.read_excel(xf, sheet_name=sheet, header=None, dtype=object)
-
-        print(f"[migrate] Sheet picked: {sheet}")
-        print(f"[migrate] Raw sheet shape: rows={df0.shape[0]}, cols={df0.shape[1]}")
-
-        # ---- Detect header row ----
-        header_row = None
-        keys = ["rev", "document no.", "document no", "doc id", "document id",
-                "document type", "doc type", "type", "file type", "description", "status"]
-        scan_upto = min(40, len(df0))  # look near the top only
-        for i in range(scan_upto):
-            cells = [str(v).strip().lower() for v in df0.iloc[i].tolist()]
-            # count how many key tokens appear in this row (as substrings)
-            hits = sum(any(k in cell for cell in cells) for k in keys)
-            if hits >= 3 and any("document" in cell for cell in cells):
-                header_row = i
-                break
-
-        # Fallback (your template usually has header at row 9 / 1-based = 9)
-        if header_row is None:
-            header_row = 8  # 0-based index -> Excel row 9
-        print(f"[migrate] Header row auto-detected: {header_row + 1} (1-based)")
-
-        # Re-read using the detected header row
-        with warnings.catch_warnings():
-            warnings.filterwarnings("ignore", category=UserWarning, module="openpyxl")
-            df = pd.read_excel(xf, sheet_name=sheet, header=header_row, dtype=object)
-
-        # Drop noise columns (Unnamed, numeric “revision number” columns, etc.)
-        keep_cols = []
-        for c in df.columns:
-            s = str(c).strip()
-            sl = s.lower()
-            if sl.startswith("unnamed"):
-                continue
-            # drop purely numeric headers like "1", "1.1" (revision number columns)
-            if sl.replace(".", "", 1).isdigit():
-                continue
-            # drop any column whose header says "revision number"
-            if "revision number" in sl:
-                continue
-            keep_cols.append(c)
-        df = df.loc[:, keep_cols]
-
-        print("[migrate] Cleaned headers:", [str(c) for c in df.columns.tolist()])
-
-        # Build a normalized header map
-        norm = {str(c).strip().lower(): c for c in df.columns}
-
-        def pick(*aliases):
-            # exact match or startswith fallback
-            for a in aliases:
-                a = a.strip().lower()
-                if a in norm: return norm[a]
-            for a in aliases:
-                a = a.strip().lower()
-                for k, raw in norm.items():
-                    if k.startswith(a): return raw
-            return None
-
-        col_doc_id = pick("document no.", "document no", "doc id", "document id", "document number")
-        col_type = pick("document type", "doc type", "type")
-        col_filetype = pick("file type")
-        col_desc = pick("description")
-        col_status = pick("status")
-        col_latest = pick("latest rev", "rev")
-
-        print("[migrate] Resolved columns ->",
-              dict(doc_id=col_doc_id, doc_type=col_type, file_type=col_filetype,
-                   description=col_desc, status=col_status, latest_rev=col_latest))
-
-        # Preview a few rows for sanity
-        try:
-            prev_cols = [c for c in [col_latest, col_doc_id, col_type, col_filetype, col_desc, col_status] if c]
-            print("[migrate] Preview:")
-            print(df[prev_cols].head(5).to_string(index=False))
-        except Exception:
-            print("[migrate] Preview skipped")
-
-        # Build candidate rows
-        rows = []
-        for _, r in df.iterrows():
-            did = "" if col_doc_id is None else r.get(col_doc_id, "")
-            did = "" if pd.isna(did) else str(did).strip()
-            if not did:
-                continue
-            rows.append({
-                "doc_id": did,
-                "doc_type": "" if col_type is None else (
-                    "" if pd.isna(r.get(col_type)) else str(r.get(col_type)).strip()),
-                "file_type": "" if col_filetype is None else (
-                    "" if pd.isna(r.get(col_filetype)) else str(r.get(col_filetype)).strip()),
-                "description": "" if col_desc is None else (
-                    "" if pd.isna(r.get(col_desc)) else str(r.get(col_desc)).strip()),
-                "status": "" if col_status is None else (
-                    "" if pd.isna(r.get(col_status)) else str(r.get(col_status)).strip()),
-                "latest_rev": "" if col_latest is None else (
-                    "" if pd.isna(r.get(col_latest)) else str(r.get(col_latest)).strip()),
-            })
-
-        print(f"[migrate] Candidate rows parsed: {len(rows)}")
-        if not rows:
+        # 2) Read + import off the GUI thread; the window stays responsive meanwhile
+        dlg = QProgressDialog("Reading workbook…", None, 0, 0, self)
+        dlg.setWindowTitle("Migrate Excel Register")
+        dlg.setWindowModality(Qt.WindowModal)
+        dlg.setMinimumDuration(0)
+        task = _MigrateTask(path, db_path, project_id)
+        task.signals.progress.connect(dlg.setLabelText)
+        task.signals.done.connect(lambda res: self._on_migrate_done(dlg, res))
+        task.signals.failed.connect(lambda tb: self._on_migrate_failed(dlg, tb))
+        self._migrate_task = task  # keep the wrapper (and its signals) alive until it reports
+        dlg.show()
+        QThreadPool.globalInstance().start(task)
+
+    def _on_migrate_done(self, dlg, res):
+        self._migrate_task = None
+        dlg.close()
+        if res is None:
             QMessageBox.information(self, "Import",
                                     "No valid rows found (couldn’t see a 'Document No.'/Doc ID column).")
             return
-
-        # Skip dupes and insert
-        from ..services.db import upsert_document, add_revision_by_docid, _connect
-        con = _connect(db_path)
-        existing = {(r[0] or "").strip().upper() for r in con.execute(
-            "SELECT doc_id FROM documents WHERE project_id=?", (project_id,)
-        )}
-        con.close()
-        print(f"[migrate] Existing doc_ids in DB: {len(existing)}")
-
-        inserted = skipped = 0
-        for doc in rows:
-            key = doc["doc_id"].strip().upper()
-            if not key or key in existing:
-                skipped += 1
-                continue
-            upsert_document(db_path, project_id, doc)
-            if doc.get("latest_rev"):
-                try:
-                    add_revision_by_docid(db_path, project_id, doc["doc_id"], doc["latest_rev"])
-                except Exception as e:
-                    print(f"[migrate] add_revision_by_docid failed for {doc['doc_id']}: {e}")
-            inserted += 1
-
-        print(f"[migrate] Done. Inserted={inserted}, Skipped={skipped}")
+        inserted, skipped = res
         self.register_tab._reload_rows()
         QMessageBox.information(self, "Migration complete",
                                 f"Imported {inserted} new document(s).\nSkipped {skipped}.")
 
+    def _on_migrate_failed(self, dlg, tb: str):
+        self._migrate_task = None
+        dlg.close()
+        _log.error("[migrate] failed:\n%s", tb)
+        QMessageBox.critical(self, "Migration failed", tb.strip().splitlines()[-1])
 
-    def _on_print_register(self):
+    @staticmethod
+    def _run_excel_migration(path: str, db_path, project_id: int, progress=lambda msg: None):
+        """
+        Worker body of the Excel migration (no widgets touched): read the register, resolve
+        its columns and import the new documents. Returns (inserted, skipped), or None when
+        no usable rows were found.
+        """
+        # pandas is only needed here; importing it lazily keeps it off every app start-up
+        import pandas as pd
+
+        _log.debug("[migrate] Opening workbook: %s", path)
+        from openpyxl import load_workbook
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", category=UserWarning, module="openpyxl")
+            # Values only, streamed row by row: no styles / formula DOM is built
+            wb = load_workbook(path, read_only=True, data_only=True)
         try:
-            from doctransmittal_sub.services.db import get_project
-        except Exception:
-            from ..services.db import get_project
+            sheet = "MI Documents" if "MI Documents" in wb.sheetnames else wb.sheetnames[0]
+            rows_it = wb[sheet].iter_rows(values_only=True)
+            # Only the top of the sheet is buffered (header detection looks near the top only);
+            # the body is streamed straight into the import below
+            head = [list(r) for r in islice(rows_it, 40)]
+            df0 = pd.DataFrame(head, dtype=object)
+            _log.debug("[migrate] Sheet picked: %s", sheet)
+
+            progress(f"Reading '{sheet}'…")
+
+            # ---- Detect header row ----
+            header_row = None
+            if len(df0):
+                # One lower-cased string per row (cells joined by " | "), then column-wise string ops
+                top = df0.astype(str).apply(lambda col: col.str.strip().str.lower())
+                joined = top.agg(" | ".join, axis=1)
+                # one regex pass drops rows with no key at all (titles, blanks) before counting
+                cand = joined[joined.str.contains(_HEADER_KEY_RE)]
+                # count how many key tokens appear in each row (as substrings)
+                hits = sum(cand.str.contains(k, regex=False).astype(int) for k in _HEADER_KEYS)
+                found = (hits >= 3) & cand.str.contains("document", regex=False)
+                if found.any():
+                    header_row = int(found.idxmax())  # first hit; labels are row positions
+
+            # Fallback (your template usually has header at row 9 / 1-based = 9)
+            if header_row is None:
+                header_row = 8  # 0-based index -> Excel row 9
+            _log.debug("[migrate] Header row auto-detected: %d (1-based)", header_row + 1)
+
+            # Column names follow read_excel(header=...): blank -> "Unnamed: i", repeats -> "name.1"
+            cols, seen = [], {}
+            for i, v in enumerate(head[header_row] if header_row < len(head) else []):
+                name = f"Unnamed: {i}" if v is None else str(v)
+                n = seen.get(name, 0)
+                seen[name] = n + 1
+                cols.append(f"{name}.{n}" if n else name)
+            pos = {c: i for i, c in enumerate(cols)}
+
+            # Drop noise columns (Unnamed, numeric “revision number” columns, etc.)
+            low = pd.Series(cols, dtype=object).str.strip().str.lower()  # Series: elementwise ~ / &
+            keep = (
+                ~low.str.startswith("unnamed")
+                # purely numeric headers like "1", "1.1" (revision number columns)
+                & ~low.str.replace(".", "", n=1, regex=False).str.isdigit()
+                # any column whose header says "revision number"
+                & ~low.str.contains("revision number", regex=False)
+            )
+            keep = keep.to_numpy(dtype=bool)
+            kept = [c for c, k in zip(cols, keep) if k]
+
+            _log.debug("[migrate] Cleaned headers: %s", kept)
+
+            # Build a normalized header map
+            norm = dict(zip(low[keep], kept))
+
+            def pick(*aliases):
+                # aliases are lower-case literals: O(1) exact lookups, then a startswith fallback
+                hit = next((norm[a] for a in aliases if a in norm), None)
+                if hit is None:
+                    hit = next((raw for a in aliases for k, raw in norm.items() if k.startswith(a)), None)
+                return hit
+
+            col_doc_id = pick("document no.", "document no", "doc id", "document id", "document number")
+            col_type = pick("document type", "doc type", "type")
+            col_filetype = pick("file type")
+            col_desc = pick("description")
+            col_status = pick("status")
+            col_latest = pick("latest rev", "rev")
+
+            fields = {"doc_id": col_doc_id, "doc_type": col_type, "file_type": col_filetype,
+                      "description": col_desc, "status": col_status, "latest_rev": col_latest}
+            _log.debug("[migrate] Resolved columns -> %s", fields)
+            if col_doc_id is None:
+                return None
+
+            # Candidate rows are built lazily from the picked cell positions only
+            at = [(k, pos[c] if c is not None else None) for k, c in fields.items()]
+
+            def candidates(body):
+                for r in body:
+                    row = {k: ("" if i is None or i >= len(r) else _cell_text(r[i])) for k, i in at}
+                    if row["doc_id"]:
+                        yield row
+
+            if _DEBUG:
+                # Preview a few rows for sanity (from the buffered top of the sheet)
+                for row in islice(candidates(head[header_row + 1:]), 5):
+                    _log.debug("[migrate] Preview: %s", row)
+
+            # Skip dupes and insert: staged and anti-joined against the project in SQLite,
+            # documents + their latest revisions in one transaction
+            progress(f"Importing from '{sheet}'…")
+            inserted, skipped = insert_new_documents_bulk(
+                db_path, project_id, candidates(chain(head[header_row + 1:], rows_it)))
+        finally:
+            wb.close()
+
+        _log.debug("[migrate] Candidate rows parsed: %d", inserted + skipped)
+        if not inserted + skipped:
+            return None
+        _log.info("[migrate] Done. Inserted=%d, Skipped=%d", inserted, skipped)
+        return inserted, skipped
+
 
+    def _on_print_register(self):
         if not getattr(self.register_tab, "db_path", None):
             QMessageBox.information(self, "Project", "Open a project database first.")
             return
@@ -917,12 +799,10 @@ class MainWindow(QMainWindow):
             "_pdf_out_path": str(out_pdf),  # also helps logo fallback near output
         }
 
-        from ..services.receipt_pdf import export_register_report_pdf
         pdf_path = export_register_report_pdf(out_pdf, header, db_path=db_path, project_id=pid)
 
         QMessageBox.information(self, "Register PDF", f"Saved:\n{pdf_path}")
         try:
-            import webbrowser
             webbrowser.open_new(str(pdf_path))
         except Exception:
             pass
@@ -974,16 +854,14 @@ class MainWindow(QMainWindow):
 
         QMessageBox.information(self, "Progress Report", f"Saved:\n{out_pdf}")
         try:
-            import webbrowser
             webbrowser.open_new(str(out_pdf))
         except Exception:
             pass
 
     def _open_appearance_dialog(self):
-        # Lazy import to avoid circulars if any
-        from .widgets.appearance_dialog import AppearanceDialog
-        cur_theme = (self.settings.get("ui.theme", "dark") or "dark").lower()
-        cur_delta = int(self.settings.get("ui.font_delta", 0) or 0)
+        ui = self.settings.snapshot("ui.")
+        cur_theme = (ui.get("theme", "dark") or "dark").lower()
+        cur_delta = int(ui.get("font_delta", 0) or 0)
         dlg = AppearanceDialog(cur_theme, cur_delta, parent=self)
         if dlg.exec_() == dlg.Accepted:
             theme, delta = dlg.values()
@@ -996,35 +874,48 @@ class MainWindow(QMainWindow):
         self._apply_theme()
         self.apply_theme_to_open_dialogs()
 
+    def track_themed_dialog(self, dlg: QDialog):
+        """Register a dialog with an _apply_theme() method; it is dropped once garbage-collected."""
+        self._themed_dialogs.add(dlg)
+
     def apply_theme_to_open_dialogs(self):
-        for w in QApplication.topLevelWidgets():
-            if isinstance(w, QDialog):
-                try:
-                    if hasattr(w, "_apply_theme"):
-                        w._apply_theme()
-                except Exception:
-                    pass
+        for dlg in list(self._themed_dialogs):
+            try:
+                if dlg.isVisible():
+                    dlg._apply_theme()
+            except Exception:
+                pass  # includes dialogs whose C++ side is already gone
 
     def _init_appearance_defaults(self):
         """Capture a stable base font once and load saved appearance prefs."""
+        # One read of the "ui" section; set() below keeps the snapshot in step
+        ui = self.settings.snapshot("ui.")
+
+        def ensure(key, value):
+            if ui.get(key) is None:
+                ui[key] = value
+                self.settings.set(f"ui.{key}", value)
+
+        # Ensure defaults exist for theme and font delta
+        ensure("theme", "dark")
+        ensure("font_delta", 0)
+
+        # Base already captured on an earlier run: no Qt font objects needed
+        if ui.get("base_point_size") is not None and ui.get("base_font_family"):
+            self._base_font_pt = int(ui["base_point_size"] or 10)
+            self._base_font_family = ui["base_font_family"]
+            return
+
         app = QApplication.instance()
         default_font = app.font() if app else QFont()
 
         # Persist a stable base so we don't 'compound' deltas on every apply()
-        if self.settings.get("ui.base_point_size") is None:
-            self.settings.set("ui.base_point_size", default_font.pointSize() or 10)
-        if self.settings.get("ui.base_font_family") is None:
-            self.settings.set("ui.base_font_family", default_font.family() or QFont().family())
+        ensure("base_point_size", default_font.pointSize() or 10)
+        ensure("base_font_family", default_font.family() or QFont().family())
 
         # Cache for quick access
-        self._base_font_pt = int(self.settings.get("ui.base_point_size") or 10)
-        self._base_font_family = self.settings.get("ui.base_font_family") or default_font.family()
-
-        # Ensure defaults exist for theme and font delta
-        if self.settings.get("ui.theme") is None:
-            self.settings.set("ui.theme", "dark")
-        if self.settings.get("ui.font_delta") is None:
-            self.settings.set("ui.font_delta", 0)
+        self._base_font_pt = int(ui.get("base_point_size") or 10)
+        self._base_font_family = ui.get("base_font_family") or default_font.family()
 
     def _delete_preset(self, name: str):
         name = (name or "").strip()
@@ -1048,7 +939,6 @@ class MainWindow(QMainWindow):
         if resp != QMessageBox.Yes:
             return
 
-        from ..services.db import delete_preset
         ok = delete_preset(Path(db_s), int(pid), name)
         if not ok:
             QMessageBox.information(self, "Presets", f"Preset '{name}' not found.")
@@ -1056,7 +946,6 @@ class MainWindow(QMainWindow):
 
         # Toast
         try:
-            from .widgets.toast import toast
             toast(self, f"Preset “{name}” deleted")
         except Exception:
             pass
@@ -1066,12 +955,17 @@ class MainWindow(QMainWindow):
         self.sidebar.set_project_info(job_no, project_name)
         if isinstance(db_path, Path) and db_path.exists():
             print(f"[MainWindow] wiring tabs to db_path={db_path}", flush=True)
+            self._tabs_db_path = db_path  # lazily built tabs pick this up when created
             try:
-                self.history_tab.set_db_path(db_path)
-                self.transmittal_tab.set_db_path(db_path)   # no project_root now
+                if self.history_tab is not None:
+                    self.history_tab.set_db_path(db_path)
+                if self._transmittal_page.widget is not None:
+                    self.transmittal_tab.set_db_path(db_path)   # no project_root now
                 self.sidebar.set_db_path(db_path)
-                self.rfi_tab.set_db_path(db_path)  # <— add this
-                self.checkprint_tab.set_db_path(db_path)
+                if self.rfi_tab is not None:
+                    self.rfi_tab.set_db_path(db_path)  # <— add this
+                if self.checkprint_tab is not None:
+                    self.checkprint_tab.set_db_path(db_path)
                 print("Set paths")
 
 
@@ -1180,7 +1074,7 @@ class MainWindow(QMainWindow):
         """After building a transmittal, clear state and return to Register (database) tab."""
         # Clear both workflow tabs
         try:
-            if hasattr(self.transmittal_tab, "reset"):
+            if self._transmittal_page.widget is not None:  # not built on a History remap run
                 self.transmittal_tab.reset()
         except Exception:
             pass
@@ -1213,7 +1107,7 @@ class MainWindow(QMainWindow):
                 self.files_tab.reset()
 
             # ---- Reset TRANSMITTAL TAB (if running workflows before CheckPrint) ----
-            if hasattr(self.transmittal_tab, "reset"):
+            if self._transmittal_page.widget is not None:  # not built on a History remap run
                 self.transmittal_tab.reset()
 
             # ---- Disable Transmittal + Files unless user starts flow again ----
@@ -1243,8 +1137,9 @@ class MainWindow(QMainWindow):
 
     def _return_to_history_after_remap(self, trans_number: str, trans_dir_path: str):
         # Refresh history and bounce user back there
+        # (if History was never opened, building it on the switch below loads it fresh)
         try:
-            if hasattr(self.history_tab, "refresh"):
+            if self.history_tab is not None:
                 self.history_tab.refresh()
         except Exception:
             pass
@@ -1265,7 +1160,8 @@ class MainWindow(QMainWindow):
             pass
         try:
             # Also refresh RFI tab explicitly
-            self.rfi_tab.set_db_path(Path(path))
+            if self.rfi_tab is not None:
+                self.rfi_tab.set_db_path(Path(path))
         except Exception:
             pass
 
@@ -1315,9 +1211,6 @@ class MainWindow(QMainWindow):
             return
 
         # Create + seed defaults (so Manage Lists isn't blank)
-        from ..services.db import init_db, upsert_project, get_project, set_row_options
-        from .row_attributes_editor import DEFAULT_ROW_OPTIONS
-
         init_db(p)
         upsert_project(p, code.strip(), name.strip(), str(p.parent))
         try:
@@ -14,8 +14,11 @@ class ManageAreasDialog(QDialog):
         self.tbl = QTableWidget(0, 2, self)
         self.tbl.setHorizontalHeaderLabels(["Code (2-digit)", "Description"])
         self.tbl.horizontalHeader().setStretchLastSection(True)
-        for code, desc in self._areas:
-            self._append_row(code, desc)
+        # Size once and fill in place (one insert, not one insertRow per area)
+        self.tbl.setRowCount(len(self._areas))
+        for r, (code, desc) in enumerate(self._areas):
+            self.tbl.setItem(r, 0, QTableWidgetItem(code))
+            self.tbl.setItem(r, 1, QTableWidgetItem(desc))
 
         btn_add = QPushButton("Add")
         btn_del = QPushButton("Delete Selected")
@@ -48,16 +51,16 @@ class ManageAreasDialog(QDialog):
         for r in rows: self.tbl.removeRow(r)
 
     def get_rows(self):
-        out = []
+        out, seen = [], set()
         for r in range(self.tbl.rowCount()):
             code = (self.tbl.item(r, 0).text() if self.tbl.item(r, 0) else "").strip().upper()
-            desc = (self.tbl.item(r, 1).text() if self.tbl.item(r, 1) else "").strip()
-            if code: out.append((code, desc))
-        # Basic duplicate check
-        seen = set()
-        for code, _ in out:
+            if not code:
+                continue
+            # Basic duplicate check, in the same pass
             if code in seen:
                 QMessageBox.information(self, "Duplicate Code", f"Code '{code}' appears more than once.")
                 return None
             seen.add(code)
+            desc = (self.tbl.item(r, 1).text() if self.tbl.item(r, 1) else "").strip()
+            out.append((code, desc))
         return out
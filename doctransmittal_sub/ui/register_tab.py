@@ -30,7 +30,7 @@ from .manage_areas_dialog import ManageAreasDialog
 from ..services.db import (
     init_db, get_project, upsert_project,
     list_documents_with_latest, update_document_fields,
-    add_revision_by_docid, list_statuses_for_project,
+    add_revision_by_docid, add_revisions_by_docid, list_statuses_for_project,
     list_areas, upsert_area, delete_area, bulk_update_docs,
     get_row_options, set_row_options,               # NEW
     list_presets, get_preset_doc_ids, save_preset,  # NEW
@@ -1112,9 +1112,7 @@ class RegisterTab(QWidget):
         val = (val or "").strip().upper()
         if not val:
             QMessageBox.information(self, "Set Revision", "No value entered."); return
-        touched = 0
-        for did in doc_ids:
-            touched += add_revision_by_docid(self.db_path, self.project_id, did, val)
+        touched = add_revisions_by_docid(self.db_path, self.project_id, dict.fromkeys(doc_ids, val))
         prev = set(doc_ids)
         self._reload_rows()
         sel_model = self.table.selectionModel(); sel_model.clearSelection()
@@ -1161,9 +1159,7 @@ class RegisterTab(QWidget):
 
         updates = {did: self._compute_next(curr_map.get(did, "")) for did in doc_ids}
 
-        touched = 0
-        for did, rev in updates.items():
-            touched += add_revision_by_docid(self.db_path, self.project_id, did, rev)
+        touched = add_revisions_by_docid(self.db_path, self.project_id, updates)
 
         prev = set(doc_ids)
         self._reload_rows()
@@ -1211,9 +1207,7 @@ class RegisterTab(QWidget):
 
         updates = {did: self._compute_prev(curr_map.get(did, "")) for did in doc_ids}
 
-        touched = 0
-        for did, rev in updates.items():
-            touched += add_revision_by_docid(self.db_path, self.project_id, did, rev)
+        touched = add_revisions_by_docid(self.db_path, self.project_id, updates)
 
         prev = set(doc_ids)
         self._reload_rows()
@@ -120,6 +120,12 @@ class RowAttributesEditor(QDialog):
         lay.addLayout(btns)
         self._save_cb = save_cb
         self._apply_theme()  # theme-aware colors for the three list widgets
+        # Re-skin with the app when the appearance changes while open
+        mw = self.parentWidget()
+        while mw is not None and not hasattr(mw, "track_themed_dialog"):
+            mw = mw.parentWidget()
+        if mw is not None:
+            mw.track_themed_dialog(self)
 
     # --- NEW ---
     def _apply_theme(self):
@@ -0,0 +1,190 @@
+# ui/theme_qss.py
+"""
+Theme colours and stylesheet generation for MainWindow.
+Pure Python (no Qt imports), so packaged builds can compile it ahead of time
+(e.g. `cythonize -i doctransmittal_sub/ui/theme_qss.py`); the source module is used otherwise.
+"""
+from __future__ import annotations
+
+import string
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, Tuple
+
+# Main-window stylesheet, kept as a plain .qss file; ${name} slots are filled per theme by build_qss()
+_QSS_TEMPLATE = string.Template(
+    (Path(__file__).resolve().parent.parent / "resources" / "base.qss").read_text(encoding="utf-8"))
+
+
+# Theme colours, one read-only mapping per theme; unknown themes fall back to "dark"
+_PALETTES = {
+    "light": MappingProxyType({
+        "accent": "#2D5BFF",
+        "panel": "#f7f8fb",
+        "border": "#d7deea",
+        "text": "#0b1325",
+        "subtext": "#5c6b82",
+        "pane_bg": "#ffffff",
+        "head_bg": "#eef2f8",
+        "list_bg": "#ffffff",
+        "sel_bg": "rgba(45,91,255,0.14)",
+        "tree_alt": "#f2f6fc",
+        "root_bg": "#ffffff",
+        "tab_txt": "#0b1325",
+        "tab_bg": "#e9eef7",
+        "tab_bg_hover": "#dfe7f4",
+        "tab_bg_sel": "#dfe7f4",
+        "btn_bg": "#f0f3f9",
+        "btn_bg_hover": "#e7ecf7",
+        "btn_bg_press": "#dfe7f4",
+        "sel_txt": "#000",
+    }),
+    "dark": MappingProxyType({
+        "accent": "#4F7DFF",
+        "panel": "#0f1724",
+        "border": "#233044",
+        "text": "#E7ECF4",
+        "subtext": "#9fb3c8",
+        "pane_bg": "#0d1526",
+        "head_bg": "#121b2d",
+        "list_bg": "#0f1724",
+        "sel_bg": "rgba(79,125,255,0.35)",
+        "tree_alt": "#101a30",
+        "root_bg": "#0b1220",
+        "tab_txt": "rgba(255,255,255,0.92)",
+        "tab_bg": "#1b253a",
+        "tab_bg_hover": "#223154",
+        "tab_bg_sel": "#223154",
+        "btn_bg": "#19233a",
+        "btn_bg_hover": "#20304c",
+        "btn_bg_press": "#2b3e64",
+        "sel_txt": "#fff",
+    }),
+}
+
+# Set on each sidebar widget itself (not the window) so re-theming only re-polishes that subtree.
+# The 'More ▾' menu is a child of the sidebar and picks its rules up from here.
+_SIDEBAR_QSS_TEMPLATE = string.Template("""
+    #Sidebar {
+        background: ${panel};
+        border-right: 1px solid ${border};
+        padding: 10px;
+    }
+    #Sidebar QWidget { background: transparent; }
+    #Sidebar QLineEdit, #Sidebar QComboBox, #Sidebar QSpinBox, #Sidebar QTextEdit {
+        background: ${list_bg};
+        color: ${text};
+        border: 1px solid ${border};
+        border-radius: 10px;
+        padding: 7px 9px;
+    }
+    #Sidebar QComboBox QAbstractItemView {
+        background: ${list_bg};
+        color: ${text};
+        border: 1px solid ${border};
+        selection-background-color: ${sel_bg};
+        outline: 0;
+    }
+    #Sidebar QListWidget {
+        background: ${list_bg};
+        color: ${text};
+        border: 1px solid ${border};
+        border-radius: 10px;
+    }
+    #Sidebar QGroupBox {
+        color: ${text};
+        border: 1px solid ${border};
+        border-radius: 12px;
+        margin-top: 12px;
+        padding-top: 8px;
+        background: ${pane_bg};
+    }
+    #Sidebar QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 12px;
+        padding: 0 6px;
+        font-weight: 700;
+        color: ${text};
+    }
+    #Sidebar QPushButton {
+        background: ${btn_bg};
+        color: ${text};
+        border: 1px solid ${border};
+        border-radius: 12px;
+        padding: 8px 12px;
+        font-weight: 600;
+    }
+    #Sidebar QPushButton:hover  { background: ${btn_bg_hover}; }
+    #Sidebar QPushButton:pressed{ background: ${btn_bg_press}; }
+
+    /* Light 'More ▾' menu for readability */
+    QMenu#BulkMoreMenu {
+        background: #ffffff;
+        color: #111111;
+        border: 1px solid ${border};
+        border-radius: 8px;
+        padding: 6px 4px;
+    }
+    QMenu#BulkMoreMenu::separator {
+        height: 1px;
+        background: #e0e6f0;
+        margin: 6px 10px;
+    }
+    QMenu#BulkMoreMenu::item {
+        background: transparent;
+        color: #111111;
+        padding: 8px 12px;
+        border-radius: 6px;
+    }
+    QMenu#BulkMoreMenu::item:selected {
+        background: #e7f0ff;
+        color: #000000;
+    }
+    QMenu#BulkMoreMenu::item:disabled {
+        color: #9aa3b2;
+        background: transparent;
+    }
+    """)
+
+# Set on the CheckPrint tab itself (its text colour comes from the application palette)
+_CHECKPRINT_QSS_TEMPLATE = string.Template("""
+    QWidget#CheckPrintTab QLabel {
+        background: transparent;
+    }
+
+    QWidget#CheckPrintTab QGroupBox {
+        background: transparent;
+    }
+
+    QWidget#CheckPrintTab QListWidget {
+        background: transparent;
+    }
+
+    QWidget#CheckPrintTab QTreeView {
+        background: transparent;
+    }
+
+    QWidget#CheckPrintTab QTreeWidget {
+        background: transparent;
+    }
+
+    QWidget#CheckPrintTab QCheckBox {
+        background: transparent;
+    }
+    """)
+
+
+def palette(theme: str) -> Mapping[str, str]:
+    """Colours for `theme`; unknown themes get the dark palette."""
+    return _PALETTES.get(theme, _PALETTES["dark"])
+
+
+def build_qss(theme: str, target_pt: int) -> Tuple[str, str, str]:
+    """(main window, sidebar, CheckPrint tab) stylesheets for `theme` at base size `target_pt`."""
+    tab_pt = target_pt + 3
+    subs = dict(palette(theme), tab_pt=tab_pt, tab_main_pt=tab_pt + 5)
+    return (
+        _QSS_TEMPLATE.substitute(subs),
+        _SIDEBAR_QSS_TEMPLATE.substitute(subs),
+        _CHECKPRINT_QSS_TEMPLATE.substitute(subs),
+    )
@@ -0,0 +1,90 @@
+from __future__ import annotations
+from typing import List, Dict, Any, Optional, Sequence, Tuple, Union
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+# A column reads one key, or the first non-empty of several keys
+ColKey = Union[str, Tuple[str, ...]]
+
+# History tab panes
+LEFT_HEADERS: List[str] = ["Doc ID", "Revision", "Type", "Status", "Description", "File Type"]
+LEFT_KEYS: List[ColKey] = ["doc_id", ("latest_rev", "revision"), "doc_type", "status", "description", "file_type"]
+
+RIGHT_HEADERS: List[str] = LEFT_HEADERS + ["File Path"]
+RIGHT_KEYS: List[ColKey] = ["doc_id", "revision", "doc_type", "status", "description", "file_type", "file_path"]
+
+
+class HistoryRowsModel(QAbstractTableModel):
+    """
+    Read-only view over a list of row dicts (register rows / transmittal items).
+    Cells are read from the dicts on demand, so only visible rows are ever formatted.
+    """
+    def __init__(self, headers: Sequence[str], keys: Sequence[ColKey], parent=None):
+        super().__init__(parent)
+        self._headers: List[str] = list(headers)
+        self._keys: List[ColKey] = list(keys)
+        # Every key any column reads, flattened once for fingerprint()
+        self._flat_keys: Tuple[str, ...] = tuple(
+            k for key in self._keys for k in (key if isinstance(key, tuple) else (key,)))
+        self._rows: List[Dict[str, Any]] = []
+
+    def set_rows(self, rows: Optional[List[Dict[str, Any]]]) -> None:
+        rows = rows or []
+        if rows and rows is not self._rows and len(rows) == len(self._rows):
+            # Same shape: swap the data and repaint, keeping the view's rows/scroll position.
+            # (A list edited in place may have changed length behind our back: reset it.)
+            self._rows = rows
+            self.dataChanged.emit(self.index(0, 0),
+                                  self.index(len(rows) - 1, len(self._headers) - 1),
+                                  [Qt.DisplayRole])
+            return
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def fingerprint(self, rows: Optional[List[Dict[str, Any]]]) -> int:
+        """Hash of every displayed value in `rows`; equal fingerprints render identically."""
+        keys = self._flat_keys
+        return hash(tuple([tuple(map(r.get, keys)) for r in (rows or [])]))
+
+    def rows(self) -> List[Dict[str, Any]]:
+        return self._rows
+
+    def raw_row(self, r: int) -> Dict[str, Any]:
+        return self._rows[r] if 0 <= r < len(self._rows) else {}
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._headers[section] if 0 <= section < len(self._headers) else None
+        return str(section + 1)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.UserRole:
+            return self._rows[index.row()]  # the row dict itself, for selection handlers
+        if role != Qt.DisplayRole:
+            return None
+        get = self._rows[index.row()].get
+        key = self._keys[index.column()]
+        if isinstance(key, tuple):
+            for k in key:
+                v = get(k)
+                if v:
+                    return str(v)
+            return ""
+        v = get(key)
+        return "" if v is None else str(v)
+
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
@@ -0,0 +1,234 @@
+# doctransmittal_sub/ui/widgets/lazy_fs_model.py
+from __future__ import annotations
+import os
+from datetime import datetime
+from typing import List, Dict, Optional
+
+from PyQt5.QtCore import Qt, QAbstractItemModel, QModelIndex, QMimeData, QUrl
+from PyQt5.QtWidgets import QFileIconProvider
+
+
+class _Node:
+    """One file or folder. `children` stays None until the folder is fetched."""
+    __slots__ = ("path", "name", "is_dir", "parent", "row", "children", "by_name",
+                 "has_children", "size", "mtime")
+
+    def __init__(self, path: str, name: str, is_dir: bool, parent: Optional["_Node"], row: int):
+        self.path = path
+        self.name = name
+        self.is_dir = is_dir
+        self.parent = parent
+        self.row = row
+        self.children: Optional[List[_Node]] = None
+        self.by_name: Dict[str, _Node] = {}
+        self.has_children: Optional[bool] = None
+        self.size: Optional[int] = None
+        self.mtime: Optional[float] = None
+
+
+def _fmt_size(n: int) -> str:
+    if n < 1024:
+        return f"{n} bytes"
+    for unit in ("KB", "MB", "GB"):
+        n /= 1024.0
+        if n < 1024:
+            return f"{n:,.0f} {unit}" if unit == "KB" else f"{n:,.1f} {unit}"
+    return f"{n:,.1f} TB"
+
+
+class LazyFsModel(QAbstractItemModel):
+    """
+    Read-only file tree for picking files, populated on demand:
+      - nothing is listed until setRootPath()
+      - each folder is read with a single os.scandir when the view first expands it
+      - size/date are stat'ed only when a row is actually displayed
+    Exposes the small part of the QFileSystemModel API the Files tab uses
+    (setRootPath, rootPath, isDir, filePath, index_for_path) and drags files as URLs.
+    """
+    COLS = ["Name", "Size", "Type", "Date Modified"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._root: Optional[_Node] = None
+        self._root_real: str = ""
+        icons = QFileIconProvider()
+        self._dir_icon = icons.icon(QFileIconProvider.Folder)
+        self._file_icon = icons.icon(QFileIconProvider.File)
+
+    # ---- QFileSystemModel-style API ----
+    def setRootPath(self, path: str) -> QModelIndex:
+        """Show the contents of `path` at the top level; returns the view's root index."""
+        self.beginResetModel()
+        p = os.fspath(path) if path else ""
+        self._root = _Node(p, os.path.basename(p) or p, True, None, 0) if p else None
+        self._root_real = os.path.realpath(p) if p else ""
+        self.endResetModel()
+        return QModelIndex()
+
+    def rootPath(self) -> str:
+        return self._root.path if self._root else ""
+
+    def isDir(self, index: QModelIndex) -> bool:
+        node = self._node(index)
+        return bool(node and node.is_dir)
+
+    def filePath(self, index: QModelIndex) -> str:
+        node = self._node(index)
+        return node.path if node else ""
+
+    def index_for_path(self, path: str) -> QModelIndex:
+        """Index of an already-loaded row for `path`; invalid if it is not (yet) in the tree."""
+        if not self._root or not path:
+            return QModelIndex()
+        try:
+            rel = os.path.relpath(os.path.realpath(path), self._root_real)
+        except ValueError:
+            return QModelIndex()
+        if rel == os.curdir or rel == os.pardir or rel.startswith(os.pardir + os.sep):
+            return QModelIndex()
+        node = self._root
+        for part in rel.split(os.sep):
+            if node.children is None:
+                return QModelIndex()
+            node = node.by_name.get(part)
+            if node is None:
+                return QModelIndex()
+        return self.createIndex(node.row, 0, node)
+
+    # ---- structure ----
+    def _node(self, index: QModelIndex) -> Optional[_Node]:
+        if index.isValid():
+            return index.internalPointer()
+        return self._root
+
+    def index(self, row: int, column: int = 0, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        node = self._node(parent)
+        if node is None or node.children is None or not (0 <= row < len(node.children)):
+            return QModelIndex()
+        if not (0 <= column < len(self.COLS)):
+            return QModelIndex()
+        return self.createIndex(row, column, node.children[row])
+
+    def parent(self, index: QModelIndex) -> QModelIndex:
+        if not index.isValid():
+            return QModelIndex()
+        up = index.internalPointer().parent
+        if up is None or up is self._root:
+            return QModelIndex()
+        return self.createIndex(up.row, 0, up)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid() and parent.column() != 0:
+            return 0
+        node = self._node(parent)
+        if node is None or node.children is None:
+            return 0
+        return len(node.children)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(self.COLS)
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        node = self._node(parent)
+        if node is None or not node.is_dir:
+            return False
+        if node.children is not None:
+            return bool(node.children)
+        if node.has_children is None:
+            # Peek: one directory entry is enough to show the expander
+            try:
+                with os.scandir(node.path) as it:
+                    node.has_children = next(it, None) is not None
+            except OSError:
+                node.has_children = False
+        return node.has_children
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        node = self._node(parent)
+        return bool(node and node.is_dir and node.children is None)
+
+    def fetchMore(self, parent: QModelIndex):
+        node = self._node(parent)
+        if node is None or not node.is_dir or node.children is not None:
+            return
+        entries = []
+        try:
+            with os.scandir(node.path) as it:
+                for e in it:
+                    try:
+                        entries.append((e.path, e.name, e.is_dir()))
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        # Folders first, then by name (as Explorer / QFileSystemModel show them)
+        entries.sort(key=lambda t: (not t[2], t[1].casefold()))
+        children = [_Node(p, name, is_dir, node, r) for r, (p, name, is_dir) in enumerate(entries)]
+        if children:
+            self.beginInsertRows(parent, 0, len(children) - 1)
+        node.children = children
+        node.by_name = {c.name: c for c in children}
+        node.has_children = bool(children)
+        if children:
+            self.endInsertRows()
+
+    # ---- data ----
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(self.COLS):
+            return self.COLS[section]
+        return None
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node: _Node = index.internalPointer()
+        col = index.column()
+        if role == Qt.DisplayRole:
+            if col == 0:
+                return node.name
+            if col == 2:
+                if node.is_dir:
+                    return "File folder"
+                ext = os.path.splitext(node.name)[1].lstrip(".")
+                return f"{ext.upper()} File" if ext else "File"
+            if node.mtime is None:
+                try:
+                    st = os.stat(node.path)
+                    node.size, node.mtime = st.st_size, st.st_mtime
+                except OSError:
+                    node.size, node.mtime = 0, 0.0
+            if col == 1:
+                return "" if node.is_dir else _fmt_size(node.size or 0)
+            if col == 3:
+                return datetime.fromtimestamp(node.mtime).strftime("%d/%m/%Y %H:%M") if node.mtime else ""
+            return None
+        if role == Qt.DecorationRole and col == 0:
+            return self._dir_icon if node.is_dir else self._file_icon
+        if role == Qt.ToolTipRole and col == 0:
+            return node.path
+        return None
+
+    # ---- drag (files only) ----
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        f = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if not index.internalPointer().is_dir:
+            f |= Qt.ItemIsDragEnabled
+        return f
+
+    def supportedDragActions(self):
+        return Qt.CopyAction
+
+    def mimeTypes(self):
+        return ["text/uri-list"]
+
+    def mimeData(self, indexes):
+        paths = []
+        for idx in indexes:
+            node = self._node(idx) if idx.isValid() else None
+            if node and not node.is_dir and node.path not in paths:
+                paths.append(node.path)
+        md = QMimeData()
+        md.setUrls([QUrl.fromLocalFile(p) for p in paths])
+        return md
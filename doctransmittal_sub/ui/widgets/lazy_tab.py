@@ -0,0 +1,24 @@
+# ui/widgets/lazy_tab.py
+from __future__ import annotations
+from typing import Callable, Optional
+
+from PyQt5.QtWidgets import QWidget, QVBoxLayout
+
+
+class LazyTabPage(QWidget):
+    """
+    Empty tab page that builds its real widget the first time it is needed.
+    `factory` is called once by materialize(); the widget it returns fills the page.
+    """
+    def __init__(self, factory: Callable[[], QWidget], parent=None):
+        super().__init__(parent)
+        self._factory = factory
+        self.widget: Optional[QWidget] = None
+        lay = QVBoxLayout(self)
+        lay.setContentsMargins(0, 0, 0, 0)
+
+    def materialize(self) -> QWidget:
+        if self.widget is None:
+            self.widget = self._factory()
+            self.layout().addWidget(self.widget)
+        return self.widget